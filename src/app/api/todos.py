@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, date
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from ..config.database import get_db
@@ -12,6 +12,7 @@ from ..models.todo import TodoTask
 from ..models.user import User
 from ..schemas.todo import TodoCreate, TodoResponse, TodoUpdate
 from ..utils.auth import get_current_user
+from ..utils.msgpack_response import msgpack_response, wants_msgpack
 
 router = APIRouter(prefix="/todos", tags=["todos"])
 
@@ -100,12 +101,16 @@ def create_todo(
 def get_user_todos(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
+    use_msgpack: Annotated[bool, Depends(wants_msgpack)],
     status_filter: Optional[str] = None,
     crop_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[TodoTask]:
-    """Get all TODO tasks for the current user."""
+) -> Union[List[TodoTask], Response]:
+    """Get all TODO tasks for the current user.
+
+    Send ``Accept: application/msgpack`` to receive a MessagePack payload.
+    """
     query = db.query(TodoTask).filter(TodoTask.user_id == current_user.id)
 
     if status_filter:
@@ -114,7 +119,10 @@ def get_user_todos(
     if crop_id:
         query = query.filter(TodoTask.crop_id == crop_id)
 
-    return query.order_by(TodoTask.due_date).offset(skip).limit(limit).all()
+    todos = query.order_by(TodoTask.due_date).offset(skip).limit(limit).all()
+    if use_msgpack:
+        return msgpack_response(todos, TodoResponse)
+    return todos
 
 
 @router.get("/active", response_model=List[TodoResponse])
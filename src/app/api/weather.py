@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated, List
+from typing import Annotated, List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from ..config.database import get_db
@@ -10,6 +10,7 @@ from ..models.user import User
 from ..models.weather import WeatherHistory
 from ..schemas.weather import WeatherCreate, WeatherResponse
 from ..utils.auth import get_current_user
+from ..utils.msgpack_response import msgpack_response, wants_msgpack
 
 router = APIRouter(prefix="/weather", tags=["weather"])
 
@@ -167,11 +168,15 @@ def get_weather_forecast(
 def get_weather_history(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
+    use_msgpack: Annotated[bool, Depends(wants_msgpack)],
     skip: int = 0,
     limit: int = 30,
-) -> List[WeatherHistory]:
-    """Get weather history for the user."""
-    return (
+) -> Union[List[WeatherHistory], Response]:
+    """Get weather history for the user.
+
+    Send ``Accept: application/msgpack`` to receive a MessagePack payload.
+    """
+    history = (
         db.query(WeatherHistory)
         .filter(
             WeatherHistory.user_id == current_user.id,
@@ -182,6 +187,9 @@ def get_weather_history(
         .limit(limit)
         .all()
     )
+    if use_msgpack:
+        return msgpack_response(history, WeatherResponse)
+    return history
 
 
 @router.get("/{weather_id}", response_model=WeatherResponse)
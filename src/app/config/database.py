@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import orjson
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -7,11 +8,19 @@ from typing import Generator
 
 from .settings import settings
 
+
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson; non-string keys are stringified."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False}
     if "sqlite" in settings.DATABASE_URL
     else {},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Enable foreign keys for SQLite
@@ -43,6 +43,9 @@ class Settings(BaseSettings):
     # Exa AI Search API
     EXA_API_KEY: Optional[str] = os.getenv("EXA_API_KEY")
     EXA_API_URL: str = "https://api.exa.ai"
+    EXA_CACHE_TTL_SECONDS: int = 6 * 3600
+    EXA_CACHE_DIR: Optional[str] = os.getenv("EXA_CACHE_DIR")
+    EXA_CACHE_MAX_ENTRIES: int = 4096
 
     # Voice Settings
     SPEECH_LANGUAGE_CODE: str = "kn-IN"  # Kannada
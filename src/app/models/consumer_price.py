@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Text, Index
 from sqlalchemy.sql import func
 
 from ..config.database import Base
@@ -11,6 +11,9 @@ class ConsumerPrice(Base):
     """Consumer price tracking for market analysis and supply chain optimization."""
 
     __tablename__ = "consumer_prices"
+    __table_args__ = (
+        Index("ix_consumer_prices_crop_type_price_date", "crop_type", "price_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Text,
     JSON,
     Boolean,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -23,6 +24,7 @@ class DailyLog(Base):
     """Daily farm activity logs."""
 
     __tablename__ = "daily_logs"
+    __table_args__ = (Index("ix_daily_logs_crop_id_log_date", "crop_id", "log_date"),)
 
     id = Column(Integer, primary_key=True, index=True)
     crop_id = Column(Integer, ForeignKey("crops.id"), nullable=False)
@@ -255,7 +255,7 @@ class ReportVisualization(Base):
     # Chart data
     chart_data = Column(JSON)  # Raw data used to generate chart
     image_base64 = Column(Text)  # Base64 encoded image
-    image_format = Column(String, default="png")  # png, jpg, svg
+    image_format = Column(String, default="png")  # png, jpg, svg, webp
     image_size = Column(String)  # dimensions like "800x600"
 
     # Display settings
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 from datetime import date
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, ForeignKey, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    Date,
+    ForeignKey,
+    Text,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -12,6 +22,7 @@ class Sale(Base):
     """Sales tracking for farm produce."""
 
     __tablename__ = "sales"
+    __table_args__ = (Index("ix_sales_crop_id_sale_date", "crop_id", "sale_date"),)
 
     id = Column(Integer, primary_key=True, index=True)
     crop_id = Column(Integer, ForeignKey("crops.id"), nullable=False)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 
 
 class SoilAnalysisCreate(BaseModel):
@@ -69,13 +70,38 @@ class SoilAnalysisDetailed(SoilAnalysisResponse):
     raw_data: Optional[Dict[str, Any]]
 
 
+class RegistrationSoilSummary(TypedDict):
+    """Soil analysis summary included in the final registration update."""
+
+    id: int
+    ph_value: Optional[float]
+    ph_description: Optional[str]
+    organic_carbon: Optional[float]
+    soil_texture: Optional[str]
+    soil_quality_score: Optional[float]
+    analysis_status: str
+
+
+class RegistrationCompleteData(TypedDict):
+    """Payload attached to the ``complete`` registration step."""
+
+    user_id: int
+    name: str
+    email: str
+    soil_analysis: Optional[RegistrationSoilSummary]
+    recommendations: Optional[str]
+    suitable_crops: Optional[List[str]]
+
+
 class RegistrationProgress(BaseModel):
     """Schema for registration progress updates."""
 
     step: str = Field(..., description="Current step in registration")
     message: str = Field(..., description="Progress message")
     progress: int = Field(..., ge=0, le=100, description="Progress percentage")
-    data: Optional[Dict[str, Any]] = Field(None, description="Additional data")
+    data: Optional[RegistrationCompleteData] = Field(
+        None, description="Additional data"
+    )
 
 
 class RegistrationComplete(BaseModel):
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field, StringConstraints
+
+# Compiled once and shared by every model that validates these fields
+_PRIORITY_RE = re.compile(r"^(high|medium|low)$", re.ASCII)
+_STATUS_RE = re.compile(r"^(pending|in_progress|completed|cancelled)$", re.ASCII)
+_RECURRENCE_RE = re.compile(r"^(daily|weekly|monthly|seasonal)$", re.ASCII)
+
+Priority = Annotated[str, StringConstraints(pattern=_PRIORITY_RE)]
+TodoStatus = Annotated[str, StringConstraints(pattern=_STATUS_RE)]
+RecurrencePattern = Annotated[str, StringConstraints(pattern=_RECURRENCE_RE)]
 
 
 class TodoCreate(BaseModel):
@@ -10,13 +20,11 @@ class TodoCreate(BaseModel):
 
     task_title: str = Field(..., min_length=3, max_length=200)
     task_description: Optional[str] = Field(None, max_length=1000)
-    priority: str = Field(default="medium", pattern="^(high|medium|low)$")
+    priority: Priority = "medium"
     due_date: Optional[date] = None
     farm_id: Optional[int] = None
     is_recurring: bool = False
-    recurrence_pattern: Optional[str] = Field(
-        None, pattern="^(daily|weekly|monthly|seasonal)$"
-    )
+    recurrence_pattern: Optional[RecurrencePattern] = None
     recurrence_interval: int = Field(default=1, ge=1, le=365)
 
 
@@ -25,10 +33,8 @@ class TodoUpdate(BaseModel):
 
     task_title: Optional[str] = Field(None, min_length=3, max_length=200)
     task_description: Optional[str] = Field(None, max_length=1000)
-    priority: Optional[str] = Field(None, pattern="^(high|medium|low)$")
-    status: Optional[str] = Field(
-        None, pattern="^(pending|in_progress|completed|cancelled)$"
-    )
+    priority: Optional[Priority] = None
+    status: Optional[TodoStatus] = None
     due_date: Optional[date] = None
     completion_notes: Optional[str] = Field(None, max_length=500)
 
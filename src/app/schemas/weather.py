@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field, StringConstraints
+
+_RISK_LEVEL_RE = re.compile(r"^(low|medium|high)$", re.ASCII)
+
+RiskLevel = Annotated[str, StringConstraints(pattern=_RISK_LEVEL_RE)]
 
 
 class WeatherCreate(BaseModel):
@@ -31,7 +36,7 @@ class WeatherCreate(BaseModel):
     recommended_actions: Optional[str] = Field(None, max_length=1000)
     crop_impact_assessment: Optional[str] = Field(None, max_length=500)
     irrigation_recommendation: Optional[str] = Field(None, max_length=200)
-    pest_disease_risk: Optional[str] = Field(None, pattern="^(low|medium|high)$")
+    pest_disease_risk: Optional[RiskLevel] = None
 
 
 class WeatherResponse(BaseModel):
@@ -5,28 +5,56 @@ A comprehensive system for cost analysis, market trends, GTM strategy, and busin
 using multiple specialized agents. Provides data-driven insights for farmer business success.
 """
 
+import asyncio
+import functools
 import logging
-import random
+import operator
 import base64
 import io
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
 from typing import Dict, Any, List, Optional, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import json
-import statistics
 
 import google.generativeai as genai
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Float, func, lambda_stmt, literal, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
 import pandas as pd
 import numpy as np
+from PIL import Image
+
+try:
+    from numba import njit, types
+
+    # Price arrays may be read-only (pandas copy-on-write); a read-only
+    # signature accepts writable arrays as well
+    _PRICES = types.Array(types.float64, 1, "A", readonly=True)
+    _TREND_SIGNATURE = types.float64(_PRICES)
+    _VOLATILITY_SIGNATURE = types.int64(_PRICES)
+except ImportError:  # numba is optional; the kernels below run as plain Python
+    _TREND_SIGNATURE = _VOLATILITY_SIGNATURE = None
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
 
 from ...config.settings import settings
-from ...tools.exa_search import exa_search
+from ...tools.exa_search import exa_search_async
+from ...tools.gemini_text import generate_text_async
 from ...models.daily_log import DailyLog
 from ...models.todo import TodoTask
 from ...models.crop import Crop
@@ -42,9 +70,27 @@ logger = logging.getLogger(__name__)
 # Configure Gemini AI
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+# Shared by every agent; the model object is stateless between calls
+_GEMINI_FLASH = genai.GenerativeModel("gemini-2.5-flash")
+
+# Caps concurrent Exa requests across all agents to respect its rate limits
+_EXA_SEMAPHORE = asyncio.Semaphore(4)
+
+# Random generator and 1/3/6 month factor ranges for price forecasts
+_FORECAST_RNG = np.random.default_rng()
+_FORECAST_FACTOR_LOW = np.array([0.95, 0.90, 0.85])
+_FORECAST_FACTOR_HIGH = np.array([1.15, 1.25, 1.35])
+
+# Weights of the data, market, cost and visualization quality factors in the
+# analysis confidence score
+_CONFIDENCE_WEIGHTS = np.array([0.3, 0.3, 0.3, 0.1])
+
 # Set matplotlib backend for headless operation
-plt.switch_backend("Agg")
+matplotlib.use("Agg")
 sns.set_style("whitegrid")
+plt.style.use("seaborn-v0_8")
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["agg.path.chunksize"] = 10000
 
 
 class AnalysisType(str, Enum):
@@ -108,6 +154,9 @@ class CostBreakdown(BaseModel):
     total_cost_per_acre: float = Field(..., description="Total cost per acre")
     cost_per_unit: float = Field(..., description="Cost per unit of produce")
 
+    class Config:
+        frozen = True
+
 
 class ROIAnalysis(BaseModel):
     """Return on Investment analysis."""
@@ -121,6 +170,9 @@ class ROIAnalysis(BaseModel):
     break_even_price: float = Field(..., description="Break-even price per unit")
     profit_margin: float = Field(..., description="Profit margin percentage")
 
+    class Config:
+        frozen = True
+
 
 class MarketTrendAnalysis(BaseModel):
     """Market trend analysis results."""
@@ -146,6 +198,9 @@ class MarketTrendAnalysis(BaseModel):
         ..., description="Supply-demand balance analysis"
     )
 
+    class Config:
+        frozen = True
+
 
 class GTMStrategy(BaseModel):
     """Go-to-Market strategy recommendations."""
@@ -167,6 +222,9 @@ class GTMStrategy(BaseModel):
         ..., description="Strategic partnership opportunities"
     )
 
+    class Config:
+        frozen = True
+
 
 class ConsumerInsights(BaseModel):
     """Consumer demand and behavior analysis."""
@@ -194,6 +252,9 @@ class ConsumerInsights(BaseModel):
         ..., description="Local vs export market preference"
     )
 
+    class Config:
+        frozen = True
+
 
 class CompetitiveAnalysis(BaseModel):
     """Competitive landscape analysis."""
@@ -216,6 +277,9 @@ class CompetitiveAnalysis(BaseModel):
         ..., description="Current competitive advantages"
     )
 
+    class Config:
+        frozen = True
+
 
 class FinancialProjections(BaseModel):
     """Financial planning and projections."""
@@ -239,6 +303,9 @@ class FinancialProjections(BaseModel):
         ..., description="Risk mitigation strategies"
     )
 
+    class Config:
+        frozen = True
+
 
 class DataVisualization(BaseModel):
     """Data visualization metadata."""
@@ -249,6 +316,10 @@ class DataVisualization(BaseModel):
     data_points: int = Field(..., description="Number of data points")
     time_period: str = Field(..., description="Time period covered")
     image_base64: str = Field(..., description="Base64 encoded chart image")
+    image_format: str = Field("png", description="Encoding of image_base64")
+
+    class Config:
+        frozen = True
 
 
 class BusinessOptimizationRecommendations(BaseModel):
@@ -279,6 +350,9 @@ class BusinessOptimizationRecommendations(BaseModel):
         ..., description="Farmer capacity building needs"
     )
 
+    class Config:
+        frozen = True
+
 
 class ComprehensiveBusinessReport(BaseModel):
     """Complete business intelligence analysis report."""
@@ -339,14 +413,513 @@ class ComprehensiveBusinessReport(BaseModel):
     )
 
 
+# Numeric kernels
+#
+# Compiled with numba when available. Explicit signatures compile them at import
+# rather than on the first request, so callers pass float64 arrays. They return
+# plain numbers because numba cannot construct the Enum members; the lookup
+# tuples below map them back.
+
+# Half-over-half change thresholds: below -5% is decreasing, above +5% is
+# increasing (the lower edge is nudged down so exactly -5% stays stable)
+_TREND_THRESHOLDS = np.array([np.nextafter(-5.0, -np.inf), 5.0])
+_TREND_BY_INDEX = (
+    TrendDirection.DECREASING,
+    TrendDirection.STABLE,
+    TrendDirection.INCREASING,
+)
+_VOLATILITY_BY_CODE = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)
+
+
+@njit(_TREND_SIGNATURE, cache=True)
+def _trend_change_percent(prices):
+    """Percent change of the second-half mean over the first-half mean."""
+
+    n = prices.size
+    if n < 2:
+        return 0.0
+
+    midpoint = n // 2
+    first_half = 0.0
+    for i in range(midpoint):
+        first_half += prices[i]
+    second_half = 0.0
+    for i in range(midpoint, n):
+        second_half += prices[i]
+    first_half /= midpoint
+    second_half /= n - midpoint
+
+    return ((second_half - first_half) / first_half) * 100.0
+
+
+@njit(_VOLATILITY_SIGNATURE, cache=True)
+def _volatility_code(prices):
+    """Bucket the coefficient of variation; see ``_VOLATILITY_BY_CODE``."""
+
+    n = prices.size
+    if n < 10:
+        return 1
+
+    # Welford's update: mean and sum of squared deviations in a single pass
+    mean_price = 0.0
+    squared_diffs = 0.0
+    for i in range(n):
+        diff = prices[i] - mean_price
+        mean_price += diff / (i + 1)
+        squared_diffs += diff * (prices[i] - mean_price)
+    std_dev = (squared_diffs / (n - 1)) ** 0.5
+
+    cv = (std_dev / mean_price) * 100.0 if mean_price > 0 else 0.0
+
+    if cv < 10.0:
+        return 0
+    elif cv < 20.0:
+        return 1
+    return 2
+
+
+# (field, fail, pass) labels for each flag returned by _performance_flags
+_PERFORMANCE_LABELS = (
+    ("profitability", "needs_improvement", "good"),
+    ("cost_efficiency", "needs_improvement", "good"),
+    ("market_position", "moderate", "strong"),
+    ("financial_health", "at_risk", "stable"),
+)
+
+
+def _performance_flags(
+    roi_percentage, cost_per_unit, current_price, price_rising, profit_margin
+):
+    """Threshold checks behind ``_PERFORMANCE_LABELS``, in the same order."""
+
+    return (
+        roi_percentage > 20.0,
+        cost_per_unit < current_price * 0.7,
+        price_rising,
+        profit_margin > 15.0,
+    )
+
+
+# Cost categories tracked under activity_details["costs"] in daily logs, and
+# the per-category SUM columns built from them once at import time
+_COST_KEYS = (
+    "seeds",
+    "fertilizer",
+    "pesticide",
+    "labor",
+    "equipment",
+    "irrigation",
+    "transportation",
+    "storage",
+    "other",
+)
+
+
+class _numeric_cost(FunctionElement):
+    """
+    ``activity_details["costs"][cost_type]`` when it is a JSON number, else NULL.
+
+    Farmers' logs hold strings such as ``"7"`` or ``"N/A"`` too; those are
+    skipped rather than cast, which would fail the whole aggregate on
+    PostgreSQL.
+    """
+
+    type = Float()
+    inherit_cache = True
+    name = "numeric_cost"
+
+
+@compiles(_numeric_cost)
+def _compile_numeric_cost(element, compiler, **kw):
+    column, cost_type = (compiler.process(arg, **kw) for arg in element.clauses)
+    path = f"'$.costs.' || {cost_type}"
+    return (
+        f"CASE WHEN json_type({column}, {path}) IN ('integer', 'real') "
+        f"THEN json_extract({column}, {path}) END"
+    )
+
+
+@compiles(_numeric_cost, "postgresql")
+def _compile_numeric_cost_postgresql(element, compiler, **kw):
+    column, cost_type = (compiler.process(arg, **kw) for arg in element.clauses)
+    value = f"{column} -> 'costs' -> {cost_type}"
+    return (
+        f"CASE WHEN json_typeof({value}) = 'number' "
+        f"THEN CAST({column} -> 'costs' ->> {cost_type} AS FLOAT) END"
+    )
+
+
+_COST_TOTAL_COLUMNS = tuple(
+    func.coalesce(
+        func.sum(_numeric_cost(DailyLog.activity_details, literal(cost_type))), 0.0
+    ).label(cost_type)
+    for cost_type in _COST_KEYS
+)
+
+
+# Fallback results
+#
+# Built once at import and shared by every failed analysis, so callers must
+# treat them as read-only.
+_FALLBACK_COSTS = CostBreakdown(
+    seeds_cost=5000.0,
+    fertilizer_cost=8000.0,
+    pesticide_cost=3000.0,
+    labor_cost=12000.0,
+    equipment_cost=4000.0,
+    irrigation_cost=2000.0,
+    transportation_cost=1500.0,
+    storage_cost=1000.0,
+    other_costs=1500.0,
+    total_cost_per_acre=38000.0,
+    cost_per_unit=25.0,
+)
+
+_FALLBACK_ROI = ROIAnalysis(
+    total_investment=38000.0,
+    total_revenue=50000.0,
+    gross_profit=12000.0,
+    net_profit=10000.0,
+    roi_percentage=26.3,
+    payback_period_months=45.6,
+    break_even_price=19.0,
+    profit_margin=20.0,
+)
+
+_FALLBACK_MARKET_ANALYSIS = MarketTrendAnalysis(
+    current_price=25.0,
+    price_trend_30_days=TrendDirection.STABLE,
+    price_trend_90_days=TrendDirection.INCREASING,
+    seasonal_pattern="Seasonal variations expected",
+    price_forecast_1_month=26.5,
+    price_forecast_3_months=28.0,
+    price_forecast_6_months=30.0,
+    demand_forecast="Moderate demand expected",
+    market_volatility=RiskLevel.MEDIUM,
+    supply_demand_balance="Market conditions appear balanced",
+)
+
+_FALLBACK_GTM_STRATEGY = GTMStrategy(
+    recommended_channels=["Local markets", "Direct sales"],
+    pricing_strategy="Competitive pricing based on market rates",
+    target_markets=["Local consumers", "Wholesale buyers"],
+    competitive_advantages=["Quality produce", "Local sourcing"],
+    market_entry_timing="Seasonal market entry",
+    distribution_strategy="Traditional distribution channels",
+    marketing_recommendations=["Word-of-mouth marketing", "Local advertising"],
+    partnership_opportunities=["Local trader partnerships"],
+)
+
+# Only these analysis types run the Exa and Gemini backed GTM research; the
+# others report _FALLBACK_GTM_STRATEGY and skip those round trips
+_GTM_ANALYSIS_TYPES = frozenset({AnalysisType.GTM_STRATEGY, AnalysisType.COMPREHENSIVE})
+
+_FALLBACK_OPTIMIZATION_RECOMMENDATIONS = BusinessOptimizationRecommendations(
+    cost_reduction_opportunities=["Optimize input costs", "Improve efficiency"],
+    revenue_enhancement_strategies=["Explore new markets", "Improve quality"],
+    operational_improvements=["Streamline operations", "Improve planning"],
+    technology_adoption=["Consider modern farming techniques"],
+    market_expansion_opportunities=[MarketOpportunity.DIRECT_SALES],
+    risk_mitigation_actions=["Diversify crops", "Build reserves"],
+    sustainability_initiatives=["Adopt sustainable practices"],
+    capacity_building_needs=["Improve farming knowledge"],
+)
+
+# The orchestrator's fallback report; each failure gets a deep copy with the
+# request-specific fields filled in, since the report itself is mutable
+_FALLBACK_REPORT = ComprehensiveBusinessReport(
+    analysis_id="",
+    farmer_id=0,
+    crop_types=[],
+    analysis_period="Analysis failed",
+    cost_analysis=_FALLBACK_COSTS,
+    roi_analysis=_FALLBACK_ROI,
+    market_trends=_FALLBACK_MARKET_ANALYSIS,
+    gtm_strategy=GTMStrategy(
+        recommended_channels=["Local markets"],
+        pricing_strategy="Market-based pricing",
+        target_markets=["Local consumers"],
+        competitive_advantages=["Quality produce"],
+        market_entry_timing="Seasonal entry",
+        distribution_strategy="Traditional channels",
+        marketing_recommendations=["Local marketing"],
+        partnership_opportunities=["Local partnerships"],
+    ),
+    consumer_insights=ConsumerInsights(
+        target_demographics=["Local consumers"],
+        demand_drivers=["Quality"],
+        price_sensitivity=0.7,
+        quality_preferences=["Freshness"],
+        seasonal_demand_patterns="Seasonal variations",
+        premium_market_potential=15.0,
+        organic_demand_trend=TrendDirection.STABLE,
+        local_vs_export_preference="Local preference",
+    ),
+    competitive_analysis=CompetitiveAnalysis(
+        market_share_estimate=5.0,
+        key_competitors=["Local farms"],
+        competitive_pricing={"local": 25.0},
+        differentiation_opportunities=["Quality"],
+        market_gaps=["Premium segment"],
+        competitive_threats=["Price competition"],
+        competitive_advantages=["Local presence"],
+    ),
+    financial_projections=FinancialProjections(
+        revenue_forecast_1_year=52000,
+        profit_projection_1_year=12000,
+        cash_flow_analysis="Analysis unavailable",
+        working_capital_needs=15000,
+        investment_recommendations=["Consult expert"],
+        funding_requirements=20000,
+        financial_risks=["Market volatility"],
+        mitigation_strategies=["Diversification"],
+    ),
+    visualizations=[],
+    optimization_recommendations=BusinessOptimizationRecommendations(
+        cost_reduction_opportunities=["Optimize inputs"],
+        revenue_enhancement_strategies=["Improve quality"],
+        operational_improvements=["Streamline operations"],
+        technology_adoption=["Consider technology"],
+        market_expansion_opportunities=[MarketOpportunity.DIRECT_SALES],
+        risk_mitigation_actions=["Diversify"],
+        sustainability_initiatives=["Sustainable practices"],
+        capacity_building_needs=["Training"],
+    ),
+    immediate_actions=["Consult agricultural expert", "Review farm operations"],
+    strategic_initiatives=[
+        "Develop business plan",
+        "Seek professional guidance",
+    ],
+    executive_summary="",
+    confidence_score=0.1,
+)
+
+
+# Report Builders
+#
+# Pure functions of a handful of report figures, memoized because repeat
+# analyses of the same farm produce the same inputs. Cached results are
+# shared, so callers must treat them as read-only.
+
+
+# Consumer and competitive insights are not yet derived from farm data; only
+# the competitor price points are filled in per analysis
+_CONSUMER_INSIGHTS = ConsumerInsights(
+    target_demographics=[
+        "Urban middle class",
+        "Health-conscious consumers",
+        "Local restaurants",
+    ],
+    demand_drivers=[
+        "Quality",
+        "Freshness",
+        "Local sourcing",
+        "Organic certification",
+    ],
+    price_sensitivity=0.7,
+    quality_preferences=[
+        "Freshness",
+        "Organic",
+        "Pesticide-free",
+        "Local origin",
+    ],
+    seasonal_demand_patterns="Higher demand during festival seasons and winter months",
+    premium_market_potential=25.0,
+    organic_demand_trend=TrendDirection.INCREASING,
+    local_vs_export_preference="Strong preference for local markets with growing export potential",
+)
+
+_COMPETITIVE_ANALYSIS_TEMPLATE = CompetitiveAnalysis(
+    market_share_estimate=5.0,
+    key_competitors=[
+        "Large commercial farms",
+        "Cooperative societies",
+        "Import suppliers",
+    ],
+    competitive_pricing={},
+    differentiation_opportunities=[
+        "Quality certification",
+        "Direct sales",
+        "Organic farming",
+        "Traceability",
+    ],
+    market_gaps=[
+        "Premium organic segment",
+        "Direct-to-consumer delivery",
+        "Value-added products",
+    ],
+    competitive_threats=[
+        "Price competition",
+        "Large-scale operations",
+        "Import competition",
+    ],
+    competitive_advantages=[
+        "Local freshness",
+        "Personal relationships",
+        "Flexibility",
+        "Quality control",
+    ],
+)
+
+
+# Expected yearly revenue growth for each 90-day price trend
+_REVENUE_GROWTH_BY_TREND = {
+    TrendDirection.INCREASING: 0.15,
+    TrendDirection.STABLE: 0.05,
+    TrendDirection.DECREASING: 0.05,
+    TrendDirection.VOLATILE: 0.05,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _build_financial_projections(
+    current_revenue: float,
+    price_trend_90_days: TrendDirection,
+    total_cost_per_acre: float,
+) -> FinancialProjections:
+    """Project next year's revenue and profit from current figures."""
+
+    # Project revenue growth based on market trends
+    revenue_growth_rate = _REVENUE_GROWTH_BY_TREND[price_trend_90_days]
+
+    revenue_forecast = current_revenue * (1 + revenue_growth_rate)
+    profit_projection = revenue_forecast - (
+        total_cost_per_acre * 1.05
+    )  # Assume 5% cost increase
+
+    return FinancialProjections(
+        revenue_forecast_1_year=revenue_forecast,
+        profit_projection_1_year=profit_projection,
+        cash_flow_analysis="Positive cash flow expected with seasonal variations",
+        working_capital_needs=total_cost_per_acre * 0.3,
+        investment_recommendations=[
+            "Technology upgrade",
+            "Storage infrastructure",
+            "Quality certification",
+        ],
+        funding_requirements=total_cost_per_acre * 0.5,
+        financial_risks=[
+            "Market price volatility",
+            "Weather dependency",
+            "Input cost inflation",
+        ],
+        mitigation_strategies=[
+            "Diversification",
+            "Insurance",
+            "Contract farming",
+            "Cost optimization",
+        ],
+    )
+
+
+# Narrative of the executive summary, filled in by _build_executive_summary
+_EXECUTIVE_SUMMARY_TEMPLATE = """
+        Business analysis reveals a {roi_percentage:.1f}% ROI with total costs of ₹{total_cost_per_acre:,.0f} per acre. 
+        Current market price of ₹{current_price:.2f} shows {price_trend_30_days} trend with {market_volatility} volatility.
+        
+        Key opportunities include {channels} and premium market positioning. 
+        Cost optimization through {cost_reduction_opportunity} could improve profitability by 15-20%.
+        
+        Market forecast indicates {demand_forecast} with price projections of ₹{price_forecast_3_months:.2f} 
+        in 3 months. Strategic focus on {target_market} presents significant growth potential.
+        """
+
+
+# Market figures _build_executive_summary takes, in its argument order
+_SUMMARY_MARKET_FIELDS = operator.attrgetter(
+    "current_price",
+    "price_trend_30_days",
+    "market_volatility",
+    "demand_forecast",
+    "price_forecast_3_months",
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_executive_summary(
+    roi_percentage: float,
+    total_cost_per_acre: float,
+    current_price: float,
+    price_trend_30_days: TrendDirection,
+    market_volatility: RiskLevel,
+    demand_forecast: str,
+    price_forecast_3_months: float,
+    recommended_channels: Tuple[str, ...],
+    target_market: str,
+    cost_reduction_opportunity: str,
+    market_expansion_opportunity: MarketOpportunity,
+) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
+    """Build the executive summary, immediate actions and strategic initiatives."""
+
+    executive_summary = _EXECUTIVE_SUMMARY_TEMPLATE.format(
+        roi_percentage=roi_percentage,
+        total_cost_per_acre=total_cost_per_acre,
+        current_price=current_price,
+        price_trend_30_days=price_trend_30_days.value,
+        market_volatility=market_volatility.value,
+        channels=", ".join(recommended_channels),
+        cost_reduction_opportunity=cost_reduction_opportunity,
+        demand_forecast=demand_forecast.lower(),
+        price_forecast_3_months=price_forecast_3_months,
+        target_market=target_market,
+    )
+
+    immediate_actions = (
+        f"Implement {cost_reduction_opportunity}",
+        f"Develop {recommended_channels[0]} channel",
+        "Optimize pricing strategy based on market analysis",
+        "Establish quality control and certification processes",
+        "Create financial reserves for market volatility",
+    )
+
+    strategic_initiatives = (
+        f"Pursue {market_expansion_opportunity.value} opportunities",
+        "Develop long-term partnerships with key buyers",
+        "Invest in technology and infrastructure upgrades",
+        "Build brand recognition and customer loyalty",
+        "Implement sustainability and certification programs",
+    )
+
+    return executive_summary, immediate_actions, strategic_initiatives
+
+
 # Agent Classes
 
 
+async def _run_in_session(db: Session, query_fn, *args):
+    """Run a blocking query function in a worker thread with its own session.
+
+    SQLAlchemy sessions are not thread-safe, so each offloaded query gets a
+    short-lived session bound to the same engine as ``db``.
+    """
+
+    bind = db.get_bind()
+
+    def _call():
+        with Session(bind=bind) as session:
+            return query_fn(*args, session)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _call)
+
+
+def _unique_crops(crop_types: List[str], limit: int) -> List[str]:
+    """First ``limit`` distinct crop names, ignoring case and outer spaces."""
+
+    unique_crops: Dict[str, str] = {}
+    for crop in crop_types:
+        name = crop.strip()
+        if name:
+            unique_crops.setdefault(name.lower(), name)
+
+    return list(unique_crops.values())[:limit]
+
+
 class CostAnalysisAgent:
     """Agent responsible for cost analysis and ROI calculations."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
 
     async def analyze_costs(
         self,
@@ -360,12 +933,22 @@ class CostAnalysisAgent:
         try:
             logger.info(f"Analyzing costs for farmer {farmer_id}, crops: {crop_types}")
 
-            # Get historical data from database
-            cost_data = await self._extract_cost_data(
-                farmer_id, crop_types, db, analysis_period_months
-            )
-            revenue_data = await self._extract_revenue_data(
-                farmer_id, crop_types, db, analysis_period_months
+            # Get historical data from database (both queries run concurrently)
+            cost_data, revenue_data = await asyncio.gather(
+                _run_in_session(
+                    db,
+                    self._extract_cost_data,
+                    farmer_id,
+                    crop_types,
+                    analysis_period_months,
+                ),
+                _run_in_session(
+                    db,
+                    self._extract_revenue_data,
+                    farmer_id,
+                    crop_types,
+                    analysis_period_months,
+                ),
             )
 
             # Calculate cost breakdown
@@ -380,8 +963,8 @@ class CostAnalysisAgent:
             logger.error(f"Cost analysis failed: {e}")
             return self._create_fallback_cost_analysis()
 
-    async def _extract_cost_data(
-        self, farmer_id: int, crop_types: List[str], db: Session, months: int
+    def _extract_cost_data(
+        self, farmer_id: int, crop_types: List[str], months: int, db: Session
     ) -> Dict[str, float]:
         """Extract cost data from daily logs and other sources."""
 
@@ -389,44 +972,26 @@ class CostAnalysisAgent:
         end_date = date.today()
         start_date = end_date - timedelta(days=months * 30)
 
-        # Query daily logs for cost-related activities
-        daily_logs = (
-            db.query(DailyLog)
+        # Sum every cost category in the database
+        stmt = lambda_stmt(
+            lambda: select(*_COST_TOTAL_COLUMNS)
+            .select_from(DailyLog)
             .join(Crop)
-            .filter(
+            .where(
                 Crop.user_id == farmer_id,
-                Crop.crop_name.in_(crop_types) if crop_types != ["all"] else True,
                 DailyLog.log_date >= start_date,
                 DailyLog.log_date <= end_date,
             )
-            .all()
         )
+        if crop_types != ["all"]:
+            stmt += lambda s: s.where(Crop.crop_name.in_(crop_types))
 
-        # Extract costs from activity details
-        costs = {
-            "seeds": 0.0,
-            "fertilizer": 0.0,
-            "pesticide": 0.0,
-            "labor": 0.0,
-            "equipment": 0.0,
-            "irrigation": 0.0,
-            "transportation": 0.0,
-            "storage": 0.0,
-            "other": 0.0,
-        }
+        row = db.execute(stmt).one()
 
-        for log in daily_logs:
-            if log.activity_details and isinstance(log.activity_details, dict):
-                # Extract cost information from activity details
-                activity_costs = log.activity_details.get("costs", {})
-                for cost_type, amount in activity_costs.items():
-                    if cost_type in costs and isinstance(amount, (int, float)):
-                        costs[cost_type] += amount
+        return {cost_type: float(total) for cost_type, total in row._asdict().items()}
 
-        return costs
-
-    async def _extract_revenue_data(
-        self, farmer_id: int, crop_types: List[str], db: Session, months: int
+    def _extract_revenue_data(
+        self, farmer_id: int, crop_types: List[str], months: int, db: Session
     ) -> Dict[str, float]:
         """Extract revenue data from sales records."""
 
@@ -434,28 +999,30 @@ class CostAnalysisAgent:
         end_date = date.today()
         start_date = end_date - timedelta(days=months * 30)
 
-        # Query sales data through crop relationship
-        sales = (
-            db.query(Sale)
+        # Aggregate sales data through crop relationship
+        stmt = lambda_stmt(
+            lambda: select(
+                func.coalesce(func.sum(Sale.total_amount), 0.0),
+                func.coalesce(func.sum(Sale.quantity_kg), 0.0),
+                func.count(Sale.id),
+            )
             .join(Crop)
-            .filter(
+            .where(
                 Crop.user_id == farmer_id,
-                Sale.crop_type.in_(crop_types) if crop_types != ["all"] else True,
                 Sale.sale_date >= start_date,
                 Sale.sale_date <= end_date,
             )
-            .all()
         )
+        if crop_types != ["all"]:
+            stmt += lambda s: s.where(Sale.crop_type.in_(crop_types))
+
+        total_revenue, total_quantity, sales_count = db.execute(stmt).one()
 
         revenue_data = {
-            "total_revenue": sum(
-                sale.total_amount for sale in sales if sale.total_amount
-            ),
-            "total_quantity": sum(
-                sale.quantity_kg for sale in sales if sale.quantity_kg
-            ),
+            "total_revenue": total_revenue,
+            "total_quantity": total_quantity,
             "average_price": 0.0,
-            "sales_count": len(sales),
+            "sales_count": sales_count,
         }
 
         if revenue_data["total_quantity"] > 0:
@@ -535,39 +1102,14 @@ class CostAnalysisAgent:
     def _create_fallback_cost_analysis(self) -> Tuple[CostBreakdown, ROIAnalysis]:
         """Create fallback cost analysis when data is insufficient."""
 
-        fallback_costs = CostBreakdown(
-            seeds_cost=5000.0,
-            fertilizer_cost=8000.0,
-            pesticide_cost=3000.0,
-            labor_cost=12000.0,
-            equipment_cost=4000.0,
-            irrigation_cost=2000.0,
-            transportation_cost=1500.0,
-            storage_cost=1000.0,
-            other_costs=1500.0,
-            total_cost_per_acre=38000.0,
-            cost_per_unit=25.0,
-        )
-
-        fallback_roi = ROIAnalysis(
-            total_investment=38000.0,
-            total_revenue=50000.0,
-            gross_profit=12000.0,
-            net_profit=10000.0,
-            roi_percentage=26.3,
-            payback_period_months=45.6,
-            break_even_price=19.0,
-            profit_margin=20.0,
-        )
-
-        return fallback_costs, fallback_roi
+        return _FALLBACK_COSTS, _FALLBACK_ROI
 
 
 class MarketTrendAnalysisAgent:
     """Agent for analyzing market trends and price forecasting."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
 
     async def analyze_market_trends(
         self, crop_types: List[str], location: str, db: Session
@@ -579,11 +1121,12 @@ class MarketTrendAnalysisAgent:
                 f"Analyzing market trends for crops: {crop_types} in {location}"
             )
 
-            # Get historical price data from database
-            price_data = await self._get_historical_prices(crop_types, db)
-
-            # Conduct external market research
-            market_research = await self._conduct_market_research(crop_types, location)
+            # Get historical price data from database while external market
+            # research is in flight
+            price_data, market_research = await asyncio.gather(
+                _run_in_session(db, self._get_historical_prices, crop_types),
+                self._conduct_market_research(crop_types, location),
+            )
 
             # Analyze trends and generate forecasts
             trend_analysis = await self._analyze_price_trends(
@@ -596,114 +1139,130 @@ class MarketTrendAnalysisAgent:
             logger.error(f"Market trend analysis failed: {e}")
             return self._create_fallback_market_analysis()
 
-    async def _get_historical_prices(
+    def _get_historical_prices(
         self, crop_types: List[str], db: Session
-    ) -> List[Dict]:
+    ) -> pd.DataFrame:
         """Get historical price data from consumer_prices table."""
 
         # Get last 12 months of price data
         end_date = date.today()
         start_date = end_date - timedelta(days=365)
 
-        prices = (
-            db.query(ConsumerPrice)
-            .filter(
-                ConsumerPrice.crop_type.in_(crop_types)
-                if crop_types != ["all"]
-                else True,
+        stmt = lambda_stmt(
+            lambda: select(
+                ConsumerPrice.price_date.label("date"),
+                ConsumerPrice.crop_type.label("commodity"),
+                ConsumerPrice.price_per_kg.label("price"),
+                ConsumerPrice.market_location.label("market"),
+            ).where(
                 ConsumerPrice.price_date >= start_date,
                 ConsumerPrice.price_date <= end_date,
             )
-            .order_by(ConsumerPrice.price_date)
-            .all()
         )
+        if crop_types != ["all"]:
+            stmt += lambda s: s.where(ConsumerPrice.crop_type.in_(crop_types))
+        stmt += lambda s: s.order_by(ConsumerPrice.price_date)
 
-        price_data = []
-        for price in prices:
-            price_data.append(
-                {
-                    "date": price.price_date,
-                    "commodity": price.crop_type,
-                    "price": price.price_per_kg,
-                    "market": price.market_location,
-                    "unit": "kg",
-                }
-            )
-
-        return price_data
+        # Prices are per kg; load the columns straight into a frame
+        return pd.read_sql(stmt, db.connection(), parse_dates=["date"])
 
     async def _conduct_market_research(
         self, crop_types: List[str], location: str
     ) -> Dict[str, Any]:
         """Conduct external market research using Exa search."""
 
-        research_data = {}
-
-        for crop in crop_types[:3]:  # Limit to 3 crops to avoid API limits
+        async def _research_crop(crop: str) -> List[Dict[str, Any]]:
             try:
                 # Search for market trends and price forecasts
                 query = (
                     f"{crop} market trends price forecast India {location} 2024 2025"
                 )
 
-                result = exa_search(
-                    query=query,
-                    num_results=5,
-                    include_domains=[
-                        "agmarknet.gov.in",
-                        "agriculture.gov.in",
-                        "fao.org",
-                        "commodityindia.com",
-                        "agriwatch.com",
-                        "krishijagran.com",
-                        "business-standard.com",
-                        "economictimes.indiatimes.com",
-                    ],
-                    use_autoprompt=True,
-                    include_text=True,
-                    text_length_limit=1000,
-                )
+                async with _EXA_SEMAPHORE:
+                    result = await exa_search_async(
+                        query=query,
+                        num_results=5,
+                        include_domains=[
+                            "agmarknet.gov.in",
+                            "agriculture.gov.in",
+                            "fao.org",
+                            "commodityindia.com",
+                            "agriwatch.com",
+                            "krishijagran.com",
+                            "business-standard.com",
+                            "economictimes.indiatimes.com",
+                        ],
+                        use_autoprompt=True,
+                        include_text=True,
+                        text_length_limit=1000,
+                    )
 
                 if result["status"] == "success":
-                    research_data[crop] = result["raw_data"]
-                else:
-                    research_data[crop] = []
+                    return result["raw_data"]
+                return []
 
             except Exception as e:
                 logger.error(f"Market research failed for {crop}: {e}")
-                research_data[crop] = []
+                return []
 
-        return research_data
+        crops = _unique_crops(crop_types, 3)  # Limit to 3 crops to avoid API limits
+        if not crops:
+            return {}
+        results = await asyncio.gather(*(_research_crop(crop) for crop in crops))
+
+        return dict(zip(crops, results))
 
     async def _analyze_price_trends(
-        self, price_data: List[Dict], market_research: Dict[str, Any]
+        self, price_data: pd.DataFrame, market_research: Dict[str, Any]
     ) -> MarketTrendAnalysis:
         """Analyze price trends and generate forecasts."""
 
-        if not price_data:
+        if price_data.empty:
+            return self._create_fallback_market_analysis()
+
+        # Rows are per market and irregular, so average each commodity per
+        # calendar day, then across commodities, and window by actual dates
+        daily_prices = (
+            price_data[price_data["price"] > 0]
+            .groupby(["commodity", pd.Grouper(key="date", freq="D")])["price"]
+            .mean()
+            .groupby(level="date")
+            .mean()
+            .sort_index()
+        )
+
+        if daily_prices.empty:
             return self._create_fallback_market_analysis()
 
+        # One price array; the 30/90 day windows are views into its tail
+        prices = daily_prices.to_numpy(dtype=np.float64)
+        price_dates = daily_prices.index.to_numpy()
+        window_starts = np.searchsorted(
+            price_dates,
+            price_dates[-1] - np.array([29, 89], dtype="timedelta64[D]"),
+        )
+        recent_prices = prices[window_starts[0] :]
+        quarter_prices = prices[window_starts[1] :]
+
         # Calculate current price (latest available)
-        latest_prices = [p["price"] for p in price_data[-30:] if p["price"]]
-        current_price = statistics.mean(latest_prices) if latest_prices else 25.0
+        current_price = float(recent_prices.mean()) if recent_prices.size else 25.0
 
         # Calculate trend directions
-        recent_prices = [p["price"] for p in price_data[-30:] if p["price"]]
-        older_prices = [p["price"] for p in price_data[-90:-60] if p["price"]]
-
         trend_30_days = self._calculate_trend_direction(recent_prices)
-        trend_90_days = self._calculate_trend_direction(
-            [p["price"] for p in price_data[-90:] if p["price"]]
-        )
+        trend_90_days = self._calculate_trend_direction(quarter_prices)
 
-        # Generate price forecasts (simplified model)
-        price_forecast_1_month = current_price * random.uniform(0.95, 1.15)
-        price_forecast_3_months = current_price * random.uniform(0.90, 1.25)
-        price_forecast_6_months = current_price * random.uniform(0.85, 1.35)
+        # Generate 1/3/6 month price forecasts (simplified model)
+        forecast_factors = _FORECAST_RNG.uniform(
+            _FORECAST_FACTOR_LOW, _FORECAST_FACTOR_HIGH
+        )
+        (
+            price_forecast_1_month,
+            price_forecast_3_months,
+            price_forecast_6_months,
+        ) = (current_price * forecast_factors).tolist()
 
         # Assess market volatility
-        price_values = [p["price"] for p in price_data if p["price"]]
-        volatility = self._assess_volatility(price_values)
+        volatility = self._assess_volatility(prices)
 
         return MarketTrendAnalysis(
             current_price=current_price,
@@ -718,67 +1277,32 @@ class MarketTrendAnalysisAgent:
             supply_demand_balance="Balanced supply-demand with seasonal variations",
         )
 
-    def _calculate_trend_direction(self, prices: List[float]) -> TrendDirection:
+    def _calculate_trend_direction(self, prices: np.ndarray) -> TrendDirection:
         """Calculate trend direction from price data."""
 
-        if len(prices) < 2:
-            return TrendDirection.STABLE
-
-        # Simple trend calculation
-        first_half = statistics.mean(prices[: len(prices) // 2])
-        second_half = statistics.mean(prices[len(prices) // 2 :])
-
-        change_percent = ((second_half - first_half) / first_half) * 100
-
-        if change_percent > 5:
-            return TrendDirection.INCREASING
-        elif change_percent < -5:
-            return TrendDirection.DECREASING
-        elif abs(change_percent) > 10:
+        # Erratic prices are volatile regardless of the net direction
+        if _VOLATILITY_BY_CODE[_volatility_code(prices)] == RiskLevel.HIGH:
             return TrendDirection.VOLATILE
-        else:
-            return TrendDirection.STABLE
 
-    def _assess_volatility(self, prices: List[float]) -> RiskLevel:
-        """Assess market volatility based on price variations."""
-
-        if len(prices) < 10:
-            return RiskLevel.MEDIUM
+        change_percent = _trend_change_percent(prices)
+        return _TREND_BY_INDEX[int(np.searchsorted(_TREND_THRESHOLDS, change_percent))]
 
-        # Calculate coefficient of variation
-        mean_price = statistics.mean(prices)
-        std_dev = statistics.stdev(prices)
-        cv = (std_dev / mean_price) * 100 if mean_price > 0 else 0
+    def _assess_volatility(self, prices: np.ndarray) -> RiskLevel:
+        """Assess market volatility based on price variations."""
 
-        if cv < 10:
-            return RiskLevel.LOW
-        elif cv < 20:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.HIGH
+        return _VOLATILITY_BY_CODE[_volatility_code(prices)]
 
     def _create_fallback_market_analysis(self) -> MarketTrendAnalysis:
         """Create fallback market analysis when data is insufficient."""
 
-        return MarketTrendAnalysis(
-            current_price=25.0,
-            price_trend_30_days=TrendDirection.STABLE,
-            price_trend_90_days=TrendDirection.INCREASING,
-            seasonal_pattern="Seasonal variations expected",
-            price_forecast_1_month=26.5,
-            price_forecast_3_months=28.0,
-            price_forecast_6_months=30.0,
-            demand_forecast="Moderate demand expected",
-            market_volatility=RiskLevel.MEDIUM,
-            supply_demand_balance="Market conditions appear balanced",
-        )
+        return _FALLBACK_MARKET_ANALYSIS
 
 
 class GTMStrategyAgent:
     """Agent for developing Go-to-Market strategies."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
 
     async def develop_gtm_strategy(
         self,
@@ -793,14 +1317,10 @@ class GTMStrategyAgent:
         try:
             logger.info(f"Developing GTM strategy for crops: {crop_types}")
 
-            # Research market opportunities
-            market_opportunities = await self._research_market_opportunities(
-                crop_types, location
-            )
-
-            # Analyze competitive landscape
-            competitive_analysis = await self._analyze_competitive_landscape(
-                crop_types, location
+            # Research market opportunities and the competitive landscape
+            market_opportunities, competitive_analysis = await asyncio.gather(
+                self._research_market_opportunities(crop_types, location),
+                self._analyze_competitive_landscape(crop_types, location),
             )
 
             # Generate GTM recommendations
@@ -824,70 +1344,80 @@ class GTMStrategyAgent:
     ) -> Dict[str, Any]:
         """Research market opportunities using external data."""
 
-        opportunities = {}
-
-        for crop in crop_types[:2]:  # Limit to avoid API limits
+        async def _research_crop(crop: str) -> Optional[List[Dict[str, Any]]]:
             try:
                 query = f"{crop} market opportunities direct sales value addition {location} India"
 
-                result = exa_search(
-                    query=query,
-                    num_results=3,
-                    include_domains=[
-                        "agriculture.gov.in",
-                        "apeda.gov.in",
-                        "fpo.net.in",
-                        "nabard.org",
-                        "smallfarmers.in",
-                        "agritech.tnau.ac.in",
-                    ],
-                    use_autoprompt=True,
-                    include_text=True,
-                    text_length_limit=800,
-                )
+                async with _EXA_SEMAPHORE:
+                    result = await exa_search_async(
+                        query=query,
+                        num_results=3,
+                        include_domains=[
+                            "agriculture.gov.in",
+                            "apeda.gov.in",
+                            "fpo.net.in",
+                            "nabard.org",
+                            "smallfarmers.in",
+                            "agritech.tnau.ac.in",
+                        ],
+                        use_autoprompt=True,
+                        include_text=True,
+                        text_length_limit=800,
+                    )
 
                 if result["status"] == "success":
-                    opportunities[crop] = result["raw_data"]
+                    return result["raw_data"]
+                return None
 
             except Exception as e:
                 logger.error(f"Market opportunity research failed for {crop}: {e}")
-                opportunities[crop] = []
+                return []
 
-        return opportunities
+        crops = _unique_crops(crop_types, 2)  # Limit to avoid API limits
+        if not crops:
+            return {}
+        results = await asyncio.gather(*(_research_crop(crop) for crop in crops))
+
+        return {crop: data for crop, data in zip(crops, results) if data is not None}
 
     async def _analyze_competitive_landscape(
         self, crop_types: List[str], location: str
     ) -> Dict[str, Any]:
         """Analyze competitive landscape."""
 
-        competitive_data = {}
-
-        for crop in crop_types[:2]:
+        async def _research_crop(crop: str) -> Optional[List[Dict[str, Any]]]:
             try:
                 query = f"{crop} farmers competition pricing strategy {location} market share"
 
-                result = exa_search(
-                    query=query,
-                    num_results=3,
-                    include_domains=[
-                        "agmarknet.gov.in",
-                        "commodityindia.com",
-                        "business-standard.com",
-                        "financialexpress.com",
-                    ],
-                    use_autoprompt=True,
-                    include_text=True,
-                    text_length_limit=600,
-                )
+                async with _EXA_SEMAPHORE:
+                    result = await exa_search_async(
+                        query=query,
+                        num_results=3,
+                        include_domains=[
+                            "agmarknet.gov.in",
+                            "commodityindia.com",
+                            "business-standard.com",
+                            "financialexpress.com",
+                        ],
+                        use_autoprompt=True,
+                        include_text=True,
+                        text_length_limit=600,
+                    )
 
                 if result["status"] == "success":
-                    competitive_data[crop] = result["raw_data"]
+                    return result["raw_data"]
+                return None
 
             except Exception as e:
                 logger.error(f"Competitive analysis failed for {crop}: {e}")
-                competitive_data[crop] = []
+                return []
+
+        crops = _unique_crops(crop_types, 2)
+        if not crops:
+            return {}
+        results = await asyncio.gather(*(_research_crop(crop) for crop in crops))
 
-        return competitive_data
+        return {crop: data for crop, data in zip(crops, results) if data is not None}
 
     async def _generate_gtm_recommendations(
         self,
@@ -930,8 +1460,8 @@ class GTMStrategyAgent:
         """
 
         try:
-            response = self.model.generate_content(prompt)
-            return self._parse_gtm_response(response.text, cost_analysis, market_trends)
+            response_text = await generate_text_async(self.model, prompt)
+            return self._parse_gtm_response(response_text, cost_analysis, market_trends)
         except Exception as e:
             logger.error(f"GTM strategy generation failed: {e}")
             return self._create_fallback_gtm_strategy()
@@ -984,74 +1514,138 @@ class GTMStrategyAgent:
     def _create_fallback_gtm_strategy(self) -> GTMStrategy:
         """Create fallback GTM strategy."""
 
-        return GTMStrategy(
-            recommended_channels=["Local markets", "Direct sales"],
-            pricing_strategy="Competitive pricing based on market rates",
-            target_markets=["Local consumers", "Wholesale buyers"],
-            competitive_advantages=["Quality produce", "Local sourcing"],
-            market_entry_timing="Seasonal market entry",
-            distribution_strategy="Traditional distribution channels",
-            marketing_recommendations=["Word-of-mouth marketing", "Local advertising"],
-            partnership_opportunities=["Local trader partnerships"],
-        )
+        return _FALLBACK_GTM_STRATEGY
+
+
+class _FigurePool:
+    """Keeps one figure per chart type alive and clears it between renders.
+
+    Charts render on executor threads, so each chart type's figure is only
+    handed out while its lock is held.
+    """
+
+    def __init__(self):
+        self._figures: Dict[str, Tuple[Any, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._pool_lock = threading.Lock()
+
+    @contextmanager
+    def get(self, chart_type: str, figsize: Tuple[float, float]):
+        """Hold a cleared ``(fig, ax)`` pair for ``chart_type``."""
+
+        with self._pool_lock:
+            if chart_type not in self._figures:
+                # Figures are built directly on an Agg canvas rather than
+                # through pyplot, so they stay out of its global figure registry
+                fig = Figure(figsize=figsize, dpi=_CHART_DPI)
+                FigureCanvasAgg(fig)
+                self._figures[chart_type] = (fig, fig.subplots())
+                self._locks[chart_type] = threading.Lock()
+            lock = self._locks[chart_type]
+
+        with lock:
+            fig, ax = self._figures[chart_type]
+            ax.clear()
+            yield fig, ax
+
+
+_FIGURE_POOL = _FigurePool()
+# Charts are embedded as base64 for on-screen display, where 120 dpi is
+# plenty and far cheaper to rasterize and encode than print resolution
+_CHART_DPI = 120
+_CHART_IMAGE_FORMAT = "webp"
+
+
+def _figure_to_base64(fig) -> str:
+    """Render a figure as ``_CHART_IMAGE_FORMAT`` and return it base64 encoded.
+
+    The Agg canvas is drawn once and its RGBA buffer handed straight to
+    Pillow. Lossy WebP keeps the flat chart colors and text legible at about
+    a quarter of the size of the equivalent PNG.
+    """
+
+    fig.canvas.draw()
+    image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba()))
+    img_buffer = io.BytesIO()
+    image.save(img_buffer, format="WEBP", quality=80, method=4)
+    # Encode from a view of the buffer rather than a getvalue() copy
+    with img_buffer.getbuffer() as image_bytes:
+        return base64.b64encode(image_bytes).decode("ascii")
 
 
 class DataVisualizationAgent:
     """Agent for creating charts and data visualizations."""
 
     def __init__(self):
-        plt.style.use("seaborn-v0_8")
         self.colors = ["#2E8B57", "#FF6B35", "#F7931E", "#FFD23F", "#06D6A0", "#118AB2"]
 
+        # Static chart inputs: (label, model field) pairs, colors and styling
+        self._cost_fields = (
+            ("Seeds", "seeds_cost"),
+            ("Fertilizer", "fertilizer_cost"),
+            ("Pesticide", "pesticide_cost"),
+            ("Labor", "labor_cost"),
+            ("Equipment", "equipment_cost"),
+            ("Irrigation", "irrigation_cost"),
+            ("Transportation", "transportation_cost"),
+            ("Storage", "storage_cost"),
+            ("Other", "other_costs"),
+        )
+        self._roi_fields = (
+            ("Investment", "total_investment"),
+            ("Revenue", "total_revenue"),
+            ("Gross Profit", "gross_profit"),
+            ("Net Profit", "net_profit"),
+        )
+        self._roi_colors = self.colors[:4]
+        self._roi_bbox = dict(boxstyle="round,pad=0.3", facecolor="lightblue")
+
     async def create_cost_breakdown_chart(
         self, cost_breakdown: CostBreakdown
     ) -> DataVisualization:
         """Create cost breakdown pie chart."""
 
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._render_cost_breakdown_chart, cost_breakdown
+        )
+
+    def _render_cost_breakdown_chart(
+        self, cost_breakdown: CostBreakdown
+    ) -> DataVisualization:
+        """Render the cost breakdown pie chart."""
+
         try:
-            # Prepare data
+            # Prepare data, leaving out zero costs
             costs = {
-                "Seeds": cost_breakdown.seeds_cost,
-                "Fertilizer": cost_breakdown.fertilizer_cost,
-                "Pesticide": cost_breakdown.pesticide_cost,
-                "Labor": cost_breakdown.labor_cost,
-                "Equipment": cost_breakdown.equipment_cost,
-                "Irrigation": cost_breakdown.irrigation_cost,
-                "Transportation": cost_breakdown.transportation_cost,
-                "Storage": cost_breakdown.storage_cost,
-                "Other": cost_breakdown.other_costs,
+                label: cost
+                for label, field in self._cost_fields
+                if (cost := getattr(cost_breakdown, field)) > 0
             }
 
-            # Filter out zero costs
-            costs = {k: v for k, v in costs.items() if v > 0}
-
             # Create pie chart
-            fig, ax = plt.subplots(figsize=(10, 8))
-            wedges, texts, autotexts = ax.pie(
-                costs.values(),
-                labels=costs.keys(),
-                autopct="%1.1f%%",
-                colors=self.colors[: len(costs)],
-                startangle=90,
-            )
+            with _FIGURE_POOL.get("pie_chart", figsize=(10, 8)) as (fig, ax):
+                wedges, texts, autotexts = ax.pie(
+                    costs.values(),
+                    labels=costs.keys(),
+                    autopct="%1.1f%%",
+                    colors=self.colors[: len(costs)],
+                    startangle=90,
+                )
 
-            ax.set_title(
-                "Cost Breakdown Analysis", fontsize=16, fontweight="bold", pad=20
-            )
+                ax.set_title(
+                    "Cost Breakdown Analysis", fontsize=16, fontweight="bold", pad=20
+                )
 
-            # Improve text formatting
-            for autotext in autotexts:
-                autotext.set_color("white")
-                autotext.set_fontweight("bold")
+                # Improve text formatting
+                for autotext in autotexts:
+                    autotext.set_color("white")
+                    autotext.set_fontweight("bold")
 
-            plt.tight_layout()
+                fig.tight_layout()
 
-            # Convert to base64
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format="png", dpi=300, bbox_inches="tight")
-            img_buffer.seek(0)
-            img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-            plt.close()
+                # Convert to base64
+                img_base64 = _figure_to_base64(fig)
 
             return DataVisualization(
                 chart_type="pie_chart",
@@ -1060,6 +1654,7 @@ class DataVisualizationAgent:
                 data_points=len(costs),
                 time_period="Current analysis period",
                 image_base64=img_base64,
+                image_format=_CHART_IMAGE_FORMAT,
             )
 
         except Exception as e:
@@ -1073,52 +1668,72 @@ class DataVisualizationAgent:
     ) -> DataVisualization:
         """Create price trend line chart."""
 
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._render_price_trend_chart, market_trends, historical_data
+        )
+
+    def _render_price_trend_chart(
+        self,
+        market_trends: MarketTrendAnalysis,
+        historical_data: Optional[List[Dict]],
+    ) -> DataVisualization:
+        """Render the price trend line chart."""
+
         try:
             # Generate sample historical data if not provided
             if not historical_data:
                 dates = pd.date_range(end=datetime.now(), periods=90, freq="D")
                 base_price = market_trends.current_price
-                prices = [base_price + random.uniform(-5, 5) for _ in range(90)]
+                rng = np.random.default_rng()
+                prices = base_price + rng.uniform(-5, 5, size=90)
             else:
-                dates = [
-                    datetime.strptime(str(d["date"]), "%Y-%m-%d")
-                    for d in historical_data
-                ]
-                prices = [d["price"] for d in historical_data]
+                dates = pd.to_datetime(
+                    [d["date"] for d in historical_data], format="%Y-%m-%d"
+                )
+                prices = np.fromiter(
+                    (d["price"] for d in historical_data),
+                    dtype=np.float64,
+                    count=len(historical_data),
+                )
 
             # Create line chart
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(
-                dates, prices, color="#2E8B57", linewidth=2, marker="o", markersize=3
-            )
+            with _FIGURE_POOL.get("line_chart", figsize=(12, 6)) as (fig, ax):
+                ax.plot(
+                    dates,
+                    prices,
+                    color="#2E8B57",
+                    linewidth=2,
+                    marker="o",
+                    markersize=3,
+                )
 
-            # Add trend line
-            z = np.polyfit(range(len(prices)), prices, 1)
-            p = np.poly1d(z)
-            ax.plot(
-                dates,
-                p(range(len(prices))),
-                "--",
-                color="#FF6B35",
-                linewidth=2,
-                alpha=0.8,
-            )
+                # Add trend line
+                x = np.arange(len(prices))
+                z = np.polyfit(x, prices, 1)
+                p = np.poly1d(z)
+                ax.plot(
+                    dates,
+                    p(x),
+                    "--",
+                    color="#FF6B35",
+                    linewidth=2,
+                    alpha=0.8,
+                )
 
-            ax.set_title("Price Trend Analysis", fontsize=16, fontweight="bold", pad=20)
-            ax.set_xlabel("Date", fontsize=12)
-            ax.set_ylabel("Price (₹)", fontsize=12)
-            ax.grid(True, alpha=0.3)
+                ax.set_title(
+                    "Price Trend Analysis", fontsize=16, fontweight="bold", pad=20
+                )
+                ax.set_xlabel("Date", fontsize=12)
+                ax.set_ylabel("Price (₹)", fontsize=12)
+                ax.grid(True, alpha=0.3)
 
-            # Format x-axis
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+                # Format x-axis
+                ax.tick_params(axis="x", labelrotation=45)
+                fig.tight_layout()
 
-            # Convert to base64
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format="png", dpi=300, bbox_inches="tight")
-            img_buffer.seek(0)
-            img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-            plt.close()
+                # Convert to base64
+                img_base64 = _figure_to_base64(fig)
 
             return DataVisualization(
                 chart_type="line_chart",
@@ -1127,6 +1742,7 @@ class DataVisualizationAgent:
                 data_points=len(prices),
                 time_period="Last 90 days",
                 image_base64=img_base64,
+                image_format=_CHART_IMAGE_FORMAT,
             )
 
         except Exception as e:
@@ -1138,54 +1754,53 @@ class DataVisualizationAgent:
     ) -> DataVisualization:
         """Create ROI analysis bar chart."""
 
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._render_roi_analysis_chart, roi_analysis
+        )
+
+    def _render_roi_analysis_chart(
+        self, roi_analysis: ROIAnalysis
+    ) -> DataVisualization:
+        """Render the ROI analysis bar chart."""
+
         try:
             # Prepare data
             metrics = {
-                "Investment": roi_analysis.total_investment,
-                "Revenue": roi_analysis.total_revenue,
-                "Gross Profit": roi_analysis.gross_profit,
-                "Net Profit": roi_analysis.net_profit,
+                label: getattr(roi_analysis, field) for label, field in self._roi_fields
             }
 
             # Create bar chart
-            fig, ax = plt.subplots(figsize=(10, 6))
-            bars = ax.bar(metrics.keys(), metrics.values(), color=self.colors[:4])
+            with _FIGURE_POOL.get("bar_chart", figsize=(10, 6)) as (fig, ax):
+                bars = ax.bar(metrics.keys(), metrics.values(), color=self._roi_colors)
+
+                # Add value labels on bars
+                ax.bar_label(
+                    bars,
+                    labels=[f"₹{value:,.0f}" for value in metrics.values()],
+                    padding=3,
+                    fontweight="bold",
+                )
+
+                ax.set_title("ROI Analysis", fontsize=16, fontweight="bold", pad=20)
+                ax.set_ylabel("Amount (₹)", fontsize=12)
+                ax.grid(True, alpha=0.3, axis="y")
 
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
+                # Add ROI percentage as text
                 ax.text(
-                    bar.get_x() + bar.get_width() / 2.0,
-                    height,
-                    f"₹{height:,.0f}",
-                    ha="center",
-                    va="bottom",
+                    0.02,
+                    0.98,
+                    f"ROI: {roi_analysis.roi_percentage:.1f}%",
+                    transform=ax.transAxes,
+                    fontsize=14,
                     fontweight="bold",
+                    bbox=self._roi_bbox,
                 )
 
-            ax.set_title("ROI Analysis", fontsize=16, fontweight="bold", pad=20)
-            ax.set_ylabel("Amount (₹)", fontsize=12)
-            ax.grid(True, alpha=0.3, axis="y")
-
-            # Add ROI percentage as text
-            ax.text(
-                0.02,
-                0.98,
-                f"ROI: {roi_analysis.roi_percentage:.1f}%",
-                transform=ax.transAxes,
-                fontsize=14,
-                fontweight="bold",
-                bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue"),
-            )
-
-            plt.tight_layout()
+                fig.tight_layout()
 
-            # Convert to base64
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format="png", dpi=300, bbox_inches="tight")
-            img_buffer.seek(0)
-            img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-            plt.close()
+                # Convert to base64
+                img_base64 = _figure_to_base64(fig)
 
             return DataVisualization(
                 chart_type="bar_chart",
@@ -1194,14 +1809,20 @@ class DataVisualizationAgent:
                 data_points=len(metrics),
                 time_period="Current analysis period",
                 image_base64=img_base64,
+                image_format=_CHART_IMAGE_FORMAT,
             )
 
         except Exception as e:
             logger.error(f"ROI analysis chart creation failed: {e}")
             return self._create_fallback_visualization("roi_analysis")
 
-    def _create_fallback_visualization(self, chart_type: str) -> DataVisualization:
-        """Create fallback visualization when chart creation fails."""
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _create_fallback_visualization(chart_type: str) -> DataVisualization:
+        """Create fallback visualization when chart creation fails.
+
+        Cached per chart type, so the returned model is shared and read-only.
+        """
 
         return DataVisualization(
             chart_type=chart_type,
@@ -1217,7 +1838,7 @@ class BusinessOptimizationAgent:
     """Agent for generating business optimization recommendations."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
 
     async def generate_optimization_recommendations(
         self,
@@ -1256,19 +1877,17 @@ class BusinessOptimizationAgent:
     ) -> Dict[str, Any]:
         """Analyze current business performance."""
 
+        flags = _performance_flags(
+            roi_analysis.roi_percentage,
+            cost_analysis.cost_per_unit,
+            market_trends.current_price,
+            market_trends.price_trend_30_days == TrendDirection.INCREASING,
+            roi_analysis.profit_margin,
+        )
+
         performance = {
-            "profitability": "good"
-            if roi_analysis.roi_percentage > 20
-            else "needs_improvement",
-            "cost_efficiency": "good"
-            if cost_analysis.cost_per_unit < market_trends.current_price * 0.7
-            else "needs_improvement",
-            "market_position": "strong"
-            if market_trends.price_trend_30_days == TrendDirection.INCREASING
-            else "moderate",
-            "financial_health": "stable"
-            if roi_analysis.profit_margin > 15
-            else "at_risk",
+            name: passed if flag else failed
+            for (name, failed, passed), flag in zip(_PERFORMANCE_LABELS, flags)
         }
 
         return performance
@@ -1368,16 +1987,7 @@ class BusinessOptimizationAgent:
     ) -> BusinessOptimizationRecommendations:
         """Create fallback optimization recommendations."""
 
-        return BusinessOptimizationRecommendations(
-            cost_reduction_opportunities=["Optimize input costs", "Improve efficiency"],
-            revenue_enhancement_strategies=["Explore new markets", "Improve quality"],
-            operational_improvements=["Streamline operations", "Improve planning"],
-            technology_adoption=["Consider modern farming techniques"],
-            market_expansion_opportunities=[MarketOpportunity.DIRECT_SALES],
-            risk_mitigation_actions=["Diversify crops", "Build reserves"],
-            sustainability_initiatives=["Adopt sustainable practices"],
-            capacity_building_needs=["Improve farming knowledge"],
-        )
+        return _FALLBACK_OPTIMIZATION_RECOMMENDATIONS
 
 
 class BusinessIntelligenceOrchestrator:
@@ -1389,7 +1999,7 @@ class BusinessIntelligenceOrchestrator:
         self.gtm_agent = GTMStrategyAgent()
         self.visualization_agent = DataVisualizationAgent()
         self.optimization_agent = BusinessOptimizationAgent()
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
 
     async def conduct_comprehensive_analysis(
         self,
@@ -1407,55 +2017,43 @@ class BusinessIntelligenceOrchestrator:
         logger.info(f"Starting comprehensive business analysis: {analysis_id}")
 
         try:
-            # Step 1: Cost Analysis and ROI
+            # Steps 1-2 are independent of each other
             logger.info("Step 1: Analyzing costs and ROI...")
-            cost_breakdown, roi_analysis = await self.cost_agent.analyze_costs(
-                farmer_id, crop_types, db
-            )
-
-            # Step 2: Market Trend Analysis
             logger.info("Step 2: Analyzing market trends...")
-            market_trends = await self.market_agent.analyze_market_trends(
-                crop_types, location, db
+            (cost_breakdown, roi_analysis), market_trends = await asyncio.gather(
+                self.cost_agent.analyze_costs(farmer_id, crop_types, db),
+                self.market_agent.analyze_market_trends(crop_types, location, db),
             )
 
-            # Step 3: GTM Strategy Development
+            # Steps 3, 4, 6 and 7 only need the cost and market results; step 5
+            # starts as soon as the GTM strategy it depends on is ready
             logger.info("Step 3: Developing GTM strategy...")
-            gtm_strategy = await self.gtm_agent.develop_gtm_strategy(
-                crop_types, farm_size, location, cost_breakdown, market_trends
-            )
-
-            # Step 4: Generate Visualizations
             logger.info("Step 4: Creating data visualizations...")
-            visualizations = await self._create_visualizations(
-                cost_breakdown, roi_analysis, market_trends
-            )
-
-            # Step 5: Business Optimization Recommendations
-            logger.info("Step 5: Generating optimization recommendations...")
-            optimization_recommendations = (
-                await self.optimization_agent.generate_optimization_recommendations(
+            logger.info("Step 6: Analyzing consumer insights and competition...")
+            logger.info("Step 7: Creating financial projections...")
+            (
+                (gtm_strategy, optimization_recommendations),
+                visualizations,
+                (consumer_insights, competitive_analysis),
+                financial_projections,
+            ) = await asyncio.gather(
+                self._develop_gtm_and_optimization(
+                    farmer_id,
+                    crop_types,
+                    farm_size,
+                    location,
                     cost_breakdown,
                     roi_analysis,
                     market_trends,
-                    gtm_strategy,
-                    {"farmer_id": farmer_id},
-                )
-            )
-
-            # Step 6: Generate Consumer Insights and Competitive Analysis
-            logger.info("Step 6: Analyzing consumer insights and competition...")
-            (
-                consumer_insights,
-                competitive_analysis,
-            ) = await self._generate_market_insights(
-                crop_types, location, market_trends
-            )
-
-            # Step 7: Financial Projections
-            logger.info("Step 7: Creating financial projections...")
-            financial_projections = await self._generate_financial_projections(
-                cost_breakdown, roi_analysis, market_trends
+                    analysis_type,
+                ),
+                self._create_visualizations(
+                    cost_breakdown, roi_analysis, market_trends
+                ),
+                self._generate_market_insights(crop_types, location, market_trends),
+                self._generate_financial_projections(
+                    cost_breakdown, roi_analysis, market_trends
+                ),
             )
 
             # Step 8: Generate Executive Summary
@@ -1530,97 +2128,72 @@ class BusinessIntelligenceOrchestrator:
         visualizations = []
 
         try:
-            # Cost breakdown chart
-            cost_chart = await self.visualization_agent.create_cost_breakdown_chart(
-                cost_breakdown
-            )
-            visualizations.append(cost_chart)
-
-            # ROI analysis chart
-            roi_chart = await self.visualization_agent.create_roi_analysis_chart(
-                roi_analysis
-            )
-            visualizations.append(roi_chart)
-
-            # Price trend chart
-            price_chart = await self.visualization_agent.create_price_trend_chart(
-                market_trends
+            # Each chart type renders on its own pooled figure, so the cost,
+            # ROI and price trend charts can be drawn in parallel
+            visualizations = list(
+                await asyncio.gather(
+                    self.visualization_agent.create_cost_breakdown_chart(
+                        cost_breakdown
+                    ),
+                    self.visualization_agent.create_roi_analysis_chart(roi_analysis),
+                    self.visualization_agent.create_price_trend_chart(market_trends),
+                )
             )
-            visualizations.append(price_chart)
 
         except Exception as e:
             logger.error(f"Visualization creation failed: {e}")
 
         return visualizations
 
+    async def _develop_gtm_and_optimization(
+        self,
+        farmer_id: int,
+        crop_types: List[str],
+        farm_size: Optional[float],
+        location: str,
+        cost_breakdown: CostBreakdown,
+        roi_analysis: ROIAnalysis,
+        market_trends: MarketTrendAnalysis,
+        analysis_type: AnalysisType,
+    ) -> Tuple[GTMStrategy, BusinessOptimizationRecommendations]:
+        """Develop the GTM strategy, then the optimizations that depend on it."""
+
+        if analysis_type in _GTM_ANALYSIS_TYPES:
+            gtm_strategy = await self.gtm_agent.develop_gtm_strategy(
+                crop_types, farm_size, location, cost_breakdown, market_trends
+            )
+        else:
+            logger.info("Skipping GTM research for %s analysis", analysis_type.value)
+            gtm_strategy = _FALLBACK_GTM_STRATEGY
+
+        logger.info("Step 5: Generating optimization recommendations...")
+        optimization_recommendations = (
+            await self.optimization_agent.generate_optimization_recommendations(
+                cost_breakdown,
+                roi_analysis,
+                market_trends,
+                gtm_strategy,
+                {"farmer_id": farmer_id},
+            )
+        )
+
+        return gtm_strategy, optimization_recommendations
+
     async def _generate_market_insights(
         self, crop_types: List[str], location: str, market_trends: MarketTrendAnalysis
     ) -> Tuple[ConsumerInsights, CompetitiveAnalysis]:
         """Generate consumer insights and competitive analysis."""
 
-        # Generate consumer insights
-        consumer_insights = ConsumerInsights(
-            target_demographics=[
-                "Urban middle class",
-                "Health-conscious consumers",
-                "Local restaurants",
-            ],
-            demand_drivers=[
-                "Quality",
-                "Freshness",
-                "Local sourcing",
-                "Organic certification",
-            ],
-            price_sensitivity=0.7,
-            quality_preferences=[
-                "Freshness",
-                "Organic",
-                "Pesticide-free",
-                "Local origin",
-            ],
-            seasonal_demand_patterns="Higher demand during festival seasons and winter months",
-            premium_market_potential=25.0,
-            organic_demand_trend=TrendDirection.INCREASING,
-            local_vs_export_preference="Strong preference for local markets with growing export potential",
-        )
-
-        # Generate competitive analysis
-        competitive_analysis = CompetitiveAnalysis(
-            market_share_estimate=5.0,
-            key_competitors=[
-                "Large commercial farms",
-                "Cooperative societies",
-                "Import suppliers",
-            ],
-            competitive_pricing={
-                "local_farms": market_trends.current_price * 0.95,
-                "cooperatives": market_trends.current_price * 1.05,
-            },
-            differentiation_opportunities=[
-                "Quality certification",
-                "Direct sales",
-                "Organic farming",
-                "Traceability",
-            ],
-            market_gaps=[
-                "Premium organic segment",
-                "Direct-to-consumer delivery",
-                "Value-added products",
-            ],
-            competitive_threats=[
-                "Price competition",
-                "Large-scale operations",
-                "Import competition",
-            ],
-            competitive_advantages=[
-                "Local freshness",
-                "Personal relationships",
-                "Flexibility",
-                "Quality control",
-            ],
+        competitive_analysis = _COMPETITIVE_ANALYSIS_TEMPLATE.model_copy(
+            update={
+                "competitive_pricing": {
+                    "local_farms": market_trends.current_price * 0.95,
+                    "cooperatives": market_trends.current_price * 1.05,
+                }
+            }
         )
 
-        return consumer_insights, competitive_analysis
+        return _CONSUMER_INSIGHTS, competitive_analysis
 
     async def _generate_financial_projections(
         self,
@@ -1630,41 +2203,10 @@ class BusinessIntelligenceOrchestrator:
     ) -> FinancialProjections:
         """Generate financial projections."""
 
-        # Project revenue growth based on market trends
-        current_revenue = roi_analysis.total_revenue
-        revenue_growth_rate = (
-            0.15
-            if market_trends.price_trend_90_days == TrendDirection.INCREASING
-            else 0.05
-        )
-
-        revenue_forecast = current_revenue * (1 + revenue_growth_rate)
-        profit_projection = revenue_forecast - (
-            cost_breakdown.total_cost_per_acre * 1.05
-        )  # Assume 5% cost increase
-
-        return FinancialProjections(
-            revenue_forecast_1_year=revenue_forecast,
-            profit_projection_1_year=profit_projection,
-            cash_flow_analysis="Positive cash flow expected with seasonal variations",
-            working_capital_needs=cost_breakdown.total_cost_per_acre * 0.3,
-            investment_recommendations=[
-                "Technology upgrade",
-                "Storage infrastructure",
-                "Quality certification",
-            ],
-            funding_requirements=cost_breakdown.total_cost_per_acre * 0.5,
-            financial_risks=[
-                "Market price volatility",
-                "Weather dependency",
-                "Input cost inflation",
-            ],
-            mitigation_strategies=[
-                "Diversification",
-                "Insurance",
-                "Contract farming",
-                "Cost optimization",
-            ],
+        return _build_financial_projections(
+            roi_analysis.total_revenue,
+            market_trends.price_trend_90_days,
+            cost_breakdown.total_cost_per_acre,
         )
 
     async def _generate_executive_summary(
@@ -1677,34 +2219,21 @@ class BusinessIntelligenceOrchestrator:
     ) -> Tuple[str, List[str], List[str]]:
         """Generate executive summary and action items."""
 
-        executive_summary = f"""
-        Business analysis reveals a {roi_analysis.roi_percentage:.1f}% ROI with total costs of ₹{cost_breakdown.total_cost_per_acre:,.0f} per acre. 
-        Current market price of ₹{market_trends.current_price:.2f} shows {market_trends.price_trend_30_days} trend with {market_trends.market_volatility} volatility.
-        
-        Key opportunities include {', '.join(gtm_strategy.recommended_channels[:2])} and premium market positioning. 
-        Cost optimization through {optimization_recommendations.cost_reduction_opportunities[0]} could improve profitability by 15-20%.
-        
-        Market forecast indicates {market_trends.demand_forecast.lower()} with price projections of ₹{market_trends.price_forecast_3_months:.2f} 
-        in 3 months. Strategic focus on {gtm_strategy.target_markets[0]} presents significant growth potential.
-        """
-
-        immediate_actions = [
-            f"Implement {optimization_recommendations.cost_reduction_opportunities[0]}",
-            f"Develop {gtm_strategy.recommended_channels[0]} channel",
-            "Optimize pricing strategy based on market analysis",
-            "Establish quality control and certification processes",
-            "Create financial reserves for market volatility",
-        ]
-
-        strategic_initiatives = [
-            f"Pursue {optimization_recommendations.market_expansion_opportunities[0].value} opportunities",
-            "Develop long-term partnerships with key buyers",
-            "Invest in technology and infrastructure upgrades",
-            "Build brand recognition and customer loyalty",
-            "Implement sustainability and certification programs",
-        ]
+        (
+            executive_summary,
+            immediate_actions,
+            strategic_initiatives,
+        ) = _build_executive_summary(
+            roi_analysis.roi_percentage,
+            cost_breakdown.total_cost_per_acre,
+            *_SUMMARY_MARKET_FIELDS(market_trends),
+            tuple(gtm_strategy.recommended_channels[:2]),
+            gtm_strategy.target_markets[0],
+            optimization_recommendations.cost_reduction_opportunities[0],
+            optimization_recommendations.market_expansion_opportunities[0],
+        )
 
-        return executive_summary, immediate_actions, strategic_initiatives
+        return executive_summary, list(immediate_actions), list(strategic_initiatives)
 
     def _calculate_confidence_score(
         self,
@@ -1717,19 +2246,25 @@ class BusinessIntelligenceOrchestrator:
 
         # Base confidence factors
         data_quality = 0.7  # Would be based on actual data availability
-        market_data_quality = 0.8 if market_trends.current_price > 0 else 0.3
-        cost_data_quality = 0.9 if cost_breakdown.total_cost_per_acre > 0 else 0.4
+        market_data_quality = 0.3 + 0.5 * (market_trends.current_price > 0)
+        cost_data_quality = 0.4 + 0.5 * (cost_breakdown.total_cost_per_acre > 0)
         visualization_quality = min(visualization_count / 3.0, 1.0)
 
         # Weighted average
-        confidence = (
-            data_quality * 0.3
-            + market_data_quality * 0.3
-            + cost_data_quality * 0.3
-            + visualization_quality * 0.1
+        confidence = float(
+            np.dot(
+                _CONFIDENCE_WEIGHTS,
+                (
+                    data_quality,
+                    market_data_quality,
+                    cost_data_quality,
+                    visualization_quality,
+                ),
+            )
         )
 
-        return round(confidence, 2)
+        # Half-up to two decimals; confidence is never negative
+        return int(confidence * 100 + 0.5) / 100
 
     async def _create_fallback_report(
         self,
@@ -1740,120 +2275,15 @@ class BusinessIntelligenceOrchestrator:
     ) -> ComprehensiveBusinessReport:
         """Create fallback report when analysis fails."""
 
-        # Create minimal fallback data
-        fallback_costs = CostBreakdown(
-            seeds_cost=5000,
-            fertilizer_cost=8000,
-            pesticide_cost=3000,
-            labor_cost=12000,
-            equipment_cost=4000,
-            irrigation_cost=2000,
-            transportation_cost=1500,
-            storage_cost=1000,
-            other_costs=1500,
-            total_cost_per_acre=38000,
-            cost_per_unit=25.0,
-        )
-
-        fallback_roi = ROIAnalysis(
-            total_investment=38000,
-            total_revenue=50000,
-            gross_profit=12000,
-            net_profit=10000,
-            roi_percentage=26.3,
-            payback_period_months=45.6,
-            break_even_price=19.0,
-            profit_margin=20.0,
-        )
-
-        fallback_market = MarketTrendAnalysis(
-            current_price=25.0,
-            price_trend_30_days=TrendDirection.STABLE,
-            price_trend_90_days=TrendDirection.INCREASING,
-            seasonal_pattern="Seasonal variations expected",
-            price_forecast_1_month=26.5,
-            price_forecast_3_months=28.0,
-            price_forecast_6_months=30.0,
-            demand_forecast="Moderate demand expected",
-            market_volatility=RiskLevel.MEDIUM,
-            supply_demand_balance="Market conditions appear balanced",
-        )
-
-        fallback_gtm = GTMStrategy(
-            recommended_channels=["Local markets"],
-            pricing_strategy="Market-based pricing",
-            target_markets=["Local consumers"],
-            competitive_advantages=["Quality produce"],
-            market_entry_timing="Seasonal entry",
-            distribution_strategy="Traditional channels",
-            marketing_recommendations=["Local marketing"],
-            partnership_opportunities=["Local partnerships"],
-        )
-
-        fallback_consumer = ConsumerInsights(
-            target_demographics=["Local consumers"],
-            demand_drivers=["Quality"],
-            price_sensitivity=0.7,
-            quality_preferences=["Freshness"],
-            seasonal_demand_patterns="Seasonal variations",
-            premium_market_potential=15.0,
-            organic_demand_trend=TrendDirection.STABLE,
-            local_vs_export_preference="Local preference",
-        )
-
-        fallback_competitive = CompetitiveAnalysis(
-            market_share_estimate=5.0,
-            key_competitors=["Local farms"],
-            competitive_pricing={"local": 25.0},
-            differentiation_opportunities=["Quality"],
-            market_gaps=["Premium segment"],
-            competitive_threats=["Price competition"],
-            competitive_advantages=["Local presence"],
-        )
-
-        fallback_financial = FinancialProjections(
-            revenue_forecast_1_year=52000,
-            profit_projection_1_year=12000,
-            cash_flow_analysis="Analysis unavailable",
-            working_capital_needs=15000,
-            investment_recommendations=["Consult expert"],
-            funding_requirements=20000,
-            financial_risks=["Market volatility"],
-            mitigation_strategies=["Diversification"],
-        )
-
-        fallback_optimization = BusinessOptimizationRecommendations(
-            cost_reduction_opportunities=["Optimize inputs"],
-            revenue_enhancement_strategies=["Improve quality"],
-            operational_improvements=["Streamline operations"],
-            technology_adoption=["Consider technology"],
-            market_expansion_opportunities=[MarketOpportunity.DIRECT_SALES],
-            risk_mitigation_actions=["Diversify"],
-            sustainability_initiatives=["Sustainable practices"],
-            capacity_building_needs=["Training"],
-        )
-
-        return ComprehensiveBusinessReport(
-            analysis_id=analysis_id,
-            farmer_id=farmer_id,
-            crop_types=crop_types,
-            analysis_period="Analysis failed",
-            cost_analysis=fallback_costs,
-            roi_analysis=fallback_roi,
-            market_trends=fallback_market,
-            gtm_strategy=fallback_gtm,
-            consumer_insights=fallback_consumer,
-            competitive_analysis=fallback_competitive,
-            financial_projections=fallback_financial,
-            visualizations=[],
-            optimization_recommendations=fallback_optimization,
-            immediate_actions=["Consult agricultural expert", "Review farm operations"],
-            strategic_initiatives=[
-                "Develop business plan",
-                "Seek professional guidance",
-            ],
-            executive_summary=f"Analysis failed due to technical issues: {error_message}. Please consult agricultural business experts for comprehensive analysis.",
-            confidence_score=0.1,
+        return _FALLBACK_REPORT.model_copy(
+            update={
+                "analysis_id": analysis_id,
+                "timestamp": datetime.now(),
+                "farmer_id": farmer_id,
+                "crop_types": crop_types,
+                "executive_summary": f"Analysis failed due to technical issues: {error_message}. Please consult agricultural business experts for comprehensive analysis.",
+            },
+            deep=True,
         )
 
 
@@ -1897,11 +2327,11 @@ async def comprehensive_business_intelligence_analysis(
             create_logs_and_todos=create_logs_and_todos,
         )
 
-        # Convert to dictionary for API response
+        # JSON-native dump for the API response and report storage
         return {
             "status": "success",
             "analysis_id": report.analysis_id,
-            "report": report.dict(),
+            "report": report.model_dump(mode="json"),
         }
 
     except Exception as e:
@@ -6,35 +6,74 @@ Follows the multi-agent research pattern for thorough disease diagnosis, environ
 treatment recommendations, and yield impact analysis.
 """
 
+import asyncio
+import hashlib
 import logging
-import random
 from datetime import datetime, timedelta, date
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass
+from typing import Awaitable, Dict, Any, List, Optional
 from enum import Enum
-import base64
+from types import MappingProxyType
 import io
-from PIL import Image
 
 import google.generativeai as genai
-from pydantic import BaseModel, Field
+import numpy as np
+from cachetools import TTLCache
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from ...config.settings import settings
-from ...tools.exa_search import exa_search
+from ...tools.exa_search import exa_search_async
+from ...tools.gemini_text import generate_text_async
 from ...models.daily_log import DailyLog
 from ...models.todo import TodoTask
-from ...models.crop import Crop
-from ...config.database import get_db
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging, unless the application already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Configure Gemini AI
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+# Image identifications as JSON, keyed on the image digest, crop and normalized
+# symptoms
+_IDENTIFICATION_CACHE: TTLCache = TTLCache(maxsize=256, ttl=24 * 3600)
+
+# Weather ranges for the top 10 agricultural cities in India, one row per
+# city: temperature, humidity and rainfall (low, high) pairs
+_CITY_WEATHER_INDEX = MappingProxyType(
+    {
+        "bangalore": 0,
+        "pune": 1,
+        "hyderabad": 2,
+        "chennai": 3,
+        "coimbatore": 4,
+        "mysore": 5,
+        "salem": 6,
+        "madurai": 7,
+        "tirupur": 8,
+        "erode": 9,
+    }
+)
+_CITY_WEATHER_RANGES = np.array(
+    [
+        [15, 30, 60, 80, 5, 150],  # bangalore
+        [18, 35, 50, 75, 10, 200],  # pune
+        [20, 38, 45, 70, 15, 180],  # hyderabad
+        [24, 36, 70, 85, 20, 250],  # chennai
+        [18, 32, 65, 80, 25, 300],  # coimbatore
+        [16, 28, 60, 85, 30, 200],  # mysore
+        [20, 35, 55, 75, 15, 180],  # salem
+        [22, 38, 50, 70, 10, 150],  # madurai
+        [19, 33, 60, 80, 20, 220],  # tirupur
+        [21, 36, 55, 75, 18, 190],  # erode
+    ],
+    dtype=float,
+)
+_CITY_WEATHER_RANGES.setflags(write=False)
+
 
 class DiseaseConfidence(str, Enum):
     """Disease identification confidence levels."""
@@ -85,6 +124,9 @@ class DiseaseIdentification(BaseModel):
     )
     severity: SeverityLevel = Field(..., description="Disease severity level")
 
+    class Config:
+        frozen = True
+
 
 class EnvironmentalFactors(BaseModel):
     """Environmental factors contributing to disease."""
@@ -108,6 +150,9 @@ class EnvironmentalFactors(BaseModel):
         default=[], description="Environmental stress factors"
     )
 
+    class Config:
+        frozen = True
+
 
 class WeatherData(BaseModel):
     """Weather data for analysis."""
@@ -123,6 +168,9 @@ class WeatherData(BaseModel):
     wind_speed: float = Field(..., ge=0, description="Wind speed in km/h")
     pressure: float = Field(..., description="Atmospheric pressure in hPa")
 
+    class Config:
+        frozen = True
+
 
 class TreatmentOption(BaseModel):
     """Treatment option details."""
@@ -145,6 +193,9 @@ class TreatmentOption(BaseModel):
         default=[], description="Potential side effects or precautions"
     )
 
+    class Config:
+        frozen = True
+
 
 class PreventionStrategy(BaseModel):
     """Prevention strategy details."""
@@ -160,6 +211,9 @@ class PreventionStrategy(BaseModel):
         ..., ge=0, le=1, description="Prevention effectiveness score"
     )
 
+    class Config:
+        frozen = True
+
 
 class YieldImpact(BaseModel):
     """Yield impact analysis."""
@@ -177,6 +231,9 @@ class YieldImpact(BaseModel):
         ..., ge=0, le=1, description="Potential for yield loss mitigation"
     )
 
+    class Config:
+        frozen = True
+
 
 class ResearchFindings(BaseModel):
     """Research findings from literature."""
@@ -196,6 +253,24 @@ class ResearchFindings(BaseModel):
         default=[], description="Recent research developments"
     )
 
+    class Config:
+        frozen = True
+
+
+class FusedAnalysis(BaseModel):
+    """Environmental, research and treatment sections from a single analysis."""
+
+    environmental: EnvironmentalFactors = Field(
+        ..., description="Environmental factor analysis"
+    )
+    research: ResearchFindings = Field(..., description="Research synthesis")
+    treatments: List[TreatmentOption] = Field(
+        ..., description="Treatment recommendations"
+    )
+
+    class Config:
+        frozen = True
+
 
 class ComprehensiveDiseaseReport(BaseModel):
     """Complete disease analysis report."""
@@ -253,15 +328,408 @@ class ComprehensiveDiseaseReport(BaseModel):
     )
 
 
+# Research searches as (search type, query topic) pairs; queries are prefixed
+# with the disease and crop
+_RESEARCH_SEARCHES = (
+    ("causes", "causes pathogen lifecycle"),
+    ("treatment", "treatment control management"),
+    ("prevention", "prevention integrated pest management"),
+    ("recent_research", "recent research 2023 2024"),
+)
+
+# Domains each Exa search is restricted to
+_RESEARCH_DOMAINS = (
+    "extension.org",
+    "icar.org.in",
+    "fao.org",
+    "usda.gov",
+    "agriculture.com",
+    "researchgate.net",
+    "springer.com",
+    "sciencedirect.com",
+    "wiley.com",
+    "nature.com",
+)
+_TREATMENT_DOMAINS = (
+    "extension.org",
+    "icar.org.in",
+    "agriculture.gov.in",
+    "bayer.com",
+    "syngenta.com",
+    "corteva.com",
+    "agritech.tnau.ac.in",
+    "krishijagran.com",
+)
+_YIELD_IMPACT_DOMAINS = (
+    "fao.org",
+    "icar.org.in",
+    "agriculture.gov.in",
+    "researchgate.net",
+    "springer.com",
+    "extension.org",
+)
+
+# Characters of search text included in the synthesis prompts
+_RESEARCH_TEXT_LIMIT = 8000
+_TREATMENT_TEXT_LIMIT = 6000
+
+# Distinct source URLs cited in the research findings
+_MAX_RESEARCH_SOURCES = 10
+
+# Reports below this overall confidence (including the fallback report) get
+# no todo tasks
+_MIN_TODO_CONFIDENCE = 0.3
+
+# Per-severity tables used by the treatment and yield impact agents
+_SEVERITY_MULTIPLIER = MappingProxyType(
+    {
+        SeverityLevel.MILD: 1.0,
+        SeverityLevel.MODERATE: 0.9,
+        SeverityLevel.SEVERE: 0.8,
+        SeverityLevel.CRITICAL: 0.7,
+    }
+)
+_BASE_YIELD_LOSS = MappingProxyType(
+    {
+        SeverityLevel.MILD: 5.0,
+        SeverityLevel.MODERATE: 15.0,
+        SeverityLevel.SEVERE: 35.0,
+        SeverityLevel.CRITICAL: 60.0,
+    }
+)
+_FALLBACK_YIELD_LOSS = MappingProxyType(
+    {
+        SeverityLevel.MILD: 10.0,
+        SeverityLevel.MODERATE: 20.0,
+        SeverityLevel.SEVERE: 40.0,
+        SeverityLevel.CRITICAL: 65.0,
+    }
+)
+_QUALITY_IMPACTS = MappingProxyType(
+    {
+        SeverityLevel.MILD: "Minimal impact on crop quality. Marketable produce expected.",
+        SeverityLevel.MODERATE: "Some reduction in crop quality. May affect premium pricing.",
+        SeverityLevel.SEVERE: "Significant quality degradation. Reduced market value expected.",
+        SeverityLevel.CRITICAL: "Severe quality loss. Crop may be unsuitable for premium markets.",
+    }
+)
+_BASE_TIMELINES = MappingProxyType(
+    {
+        SeverityLevel.MILD: "1-2 weeks with treatment",
+        SeverityLevel.MODERATE: "3-4 weeks with treatment",
+        SeverityLevel.SEVERE: "6-8 weeks with intensive treatment",
+        SeverityLevel.CRITICAL: "Full season may be lost, focus on next season",
+    }
+)
+
+# Fixed parts of the identification and environmental prompts, filled in by
+# the agents' prompt builders
+_IDENTIFICATION_PROMPT_HEADER = """
+        You are an expert plant pathologist specializing in crop diseases. Analyze the provided information to identify the disease affecting this {crop_type} crop.
+        
+        """
+_IDENTIFICATION_PROMPT_TAIL = """
+        Provide a detailed analysis including:
+        1. Most likely disease name and scientific name of pathogen
+        2. Confidence level (high/medium/low/uncertain) and numerical score (0-1)
+        3. Specific symptoms that led to this identification
+        4. Plant parts affected
+        5. Disease severity assessment
+        
+        Consider common diseases for this crop type and regional factors.
+        Be specific about confidence levels - only use 'high' confidence when symptoms clearly match a specific disease.
+        """
+_ENVIRONMENTAL_PROMPT_HEADER = """
+        You are an agricultural environmental specialist. Analyze how environmental factors contribute to the development and spread of {disease_name}.
+        
+        """
+_ENVIRONMENTAL_PROMPT_WEATHER = """
+            Weather Conditions:
+            - Temperature: {weather.temperature_min}°C - {weather.temperature_max}°C (avg: {weather.temperature_avg}°C)
+            - Humidity: {weather.humidity}%
+            - Rainfall: {weather.rainfall}mm
+            - Wind Speed: {weather.wind_speed} km/h
+            
+            """
+_ENVIRONMENTAL_PROMPT_TAIL = """
+        Analyze and provide:
+        1. How soil pH affects disease development
+        2. Moisture conditions that favor this disease
+        3. Temperature ranges that promote disease
+        4. Humidity impact on disease spread
+        5. Nutrient deficiencies that increase susceptibility
+        6. Other environmental stress factors
+        
+        Be specific about the mechanisms and provide actionable insights.
+        """
+
+# Prevention strategy prompt, filled in from the identification, environmental
+# and research results
+_PREVENTION_PROMPT = """
+        Based on the disease analysis, generate 3-5 prevention strategies for {identification.disease_name}.
+        
+        Disease Information:
+        - Disease: {identification.disease_name}
+        - Severity: {identification.severity}
+        - Affected parts: {identification.affected_plant_parts}
+        
+        Environmental Factors:
+        - Soil pH impact: {environmental.soil_ph_impact}
+        - Moisture conditions: {environmental.moisture_conditions}
+        - Stress factors: {environmental.environmental_stress_factors}
+        
+        Research Findings:
+        - Spread mechanisms: {research.spread_mechanisms}
+        - Disease causes: {research.disease_causes}
+        
+        Provide specific, actionable prevention strategies including:
+        1. Cultural practices
+        2. Sanitation measures
+        3. Resistant varieties
+        4. Environmental management
+        5. Monitoring protocols
+        """
+
+# Validators for the list-shaped structured responses
+_TREATMENT_OPTIONS = TypeAdapter(List[TreatmentOption])
+_PREVENTION_STRATEGIES = TypeAdapter(List[PreventionStrategy])
+
+
+# Fallback results used when an agent's analysis fails; the models are frozen,
+# so the same instances are handed out every time
+_FALLBACK_IDENTIFICATION = DiseaseIdentification(
+    disease_name="Unknown Disease",
+    scientific_name=None,
+    confidence=DiseaseConfidence.UNCERTAIN,
+    confidence_score=0.1,
+    symptoms_observed=["unspecified symptoms"],
+    affected_plant_parts=["unknown"],
+    severity=SeverityLevel.MILD,
+)
+_FALLBACK_ENVIRONMENTAL = EnvironmentalFactors(
+    soil_ph_impact="Environmental analysis unavailable",
+    moisture_conditions="Unable to determine moisture impact",
+    temperature_range="Temperature correlation unknown",
+    humidity_impact="Humidity impact unclear",
+    nutrient_deficiencies=[],
+    environmental_stress_factors=[],
+)
+_FALLBACK_RESEARCH = ResearchFindings(
+    disease_causes=[],
+    pathogen_lifecycle=None,
+    spread_mechanisms=["unknown transmission"],
+    host_range=[],
+    research_sources=[],
+    recent_developments=[],
+)
+_FALLBACK_TREATMENTS = (
+    TreatmentOption(
+        treatment_name="General Fungicide Treatment",
+        treatment_type=TreatmentType.CHEMICAL,
+        active_ingredients=["broad spectrum fungicide"],
+        application_method="Foliar spray",
+        dosage="As per manufacturer instructions",
+        frequency="Weekly",
+        timing="Early morning",
+        cost_estimate="₹200-400 per acre",
+        availability="Local agricultural stores",
+        effectiveness=0.6,
+        side_effects=["follow safety guidelines"],
+    ),
+)
+_FALLBACK_PREVENTION_STRATEGIES = (
+    PreventionStrategy(
+        strategy_name="General Sanitation",
+        description="Maintain good field hygiene and sanitation practices",
+        implementation_steps=[
+            "Remove infected plant material",
+            "Clean farming tools",
+            "Use healthy seeds",
+        ],
+        timing="Throughout growing season",
+        cost="₹300-500 per acre",
+        effectiveness=0.6,
+    ),
+)
+
+
+# The orchestrator's fallback report; each failure gets a deep copy with the
+# request-specific fields filled in, since the report itself is mutable
+_FALLBACK_REPORT = ComprehensiveDiseaseReport(
+    analysis_id="",
+    crop_type="",
+    disease_identification=DiseaseIdentification(
+        disease_name="Unknown Disease",
+        scientific_name=None,
+        confidence=DiseaseConfidence.UNCERTAIN,
+        confidence_score=0.1,
+        symptoms_observed=["analysis failed"],
+        affected_plant_parts=["unknown"],
+        severity=SeverityLevel.MILD,
+    ),
+    environmental_analysis=EnvironmentalFactors(),
+    weather_correlation=None,
+    research_findings=ResearchFindings(
+        disease_causes=["analysis incomplete"],
+        pathogen_lifecycle=None,
+        spread_mechanisms=["unknown"],
+        host_range=[],
+        research_sources=[],
+        recent_developments=[],
+    ),
+    treatment_options=[
+        TreatmentOption(
+            treatment_name="Consult Expert",
+            treatment_type=TreatmentType.CULTURAL,
+            active_ingredients=["professional consultation"],
+            application_method="Contact agricultural extension",
+            dosage="As recommended by expert",
+            frequency="As needed",
+            timing="Immediately",
+            cost_estimate="Consultation fees",
+            availability="Local agricultural office",
+            effectiveness=0.5,
+            side_effects=[],
+        )
+    ],
+    prevention_strategies=[
+        PreventionStrategy(
+            strategy_name="General Best Practices",
+            description="Follow general agricultural best practices",
+            implementation_steps=["Maintain field hygiene", "Monitor crops regularly"],
+            timing="Continuous",
+            cost="Variable",
+            effectiveness=0.5,
+        )
+    ],
+    yield_impact=YieldImpact(
+        potential_yield_loss=20.0,
+        economic_impact="Impact assessment unavailable due to analysis failure",
+        quality_impact="Quality impact unknown",
+        market_value_impact=None,
+        recovery_timeline="Consult expert for timeline",
+        mitigation_potential=0.5,
+    ),
+    executive_summary="",
+    immediate_actions=[
+        "Contact local agricultural extension officer",
+        "Implement basic sanitation measures",
+    ],
+    long_term_recommendations=[
+        "Establish regular monitoring protocols",
+        "Consider professional consultation",
+    ],
+    confidence_overall=0.1,
+)
+
+
 # Agent Classes
 
 
+def _ellipsize(text: str, limit: int) -> str:
+    """Truncate ``text`` to ``limit`` characters, marking the cut with ``...``."""
+
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _response_schema(annotation: Any) -> Dict[str, Any]:
+    """
+    Gemini ``response_schema`` for a Pydantic model or ``List[Model]``.
+
+    Gemini takes an OpenAPI subset: ``$defs`` are inlined, ``Optional`` fields
+    become ``nullable`` and keys it rejects (``default``, ``title``, bounds) are
+    dropped. Bounds are still enforced when the response is validated.
+    """
+
+    schema = TypeAdapter(annotation).json_schema()
+    defs = schema.pop("$defs", {})
+
+    def convert(node: Dict[str, Any]) -> Dict[str, Any]:
+        if "$ref" in node or "anyOf" in node:
+            options = node.get("anyOf", [node])
+            target = next(option for option in options if option != {"type": "null"})
+            if "$ref" in target:
+                target = defs[target["$ref"].rsplit("/", 1)[-1]]
+            converted = convert(target)
+            if len(options) > 1:
+                converted["nullable"] = True
+            if "description" in node:
+                converted["description"] = node["description"]
+            return converted
+
+        converted = {
+            key: node[key]
+            for key in ("type", "format", "description", "enum", "required")
+            if key in node
+        }
+        if "items" in node:
+            converted["items"] = convert(node["items"])
+        if "properties" in node:
+            converted["properties"] = {
+                name: convert(prop) for name, prop in node["properties"].items()
+            }
+        return converted
+
+    return convert(schema)
+
+
+def _structured_output(annotation: Any) -> genai.GenerationConfig:
+    """Generation config requesting JSON that validates against ``annotation``."""
+
+    return genai.GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=_response_schema(annotation),
+    )
+
+
+# Shared by every agent; model objects are stateless between calls. Agents
+# with structured responses get one per response schema.
+_GEMINI_FLASH = genai.GenerativeModel("gemini-2.5-flash")
+_IDENTIFICATION_MODEL = genai.GenerativeModel(
+    "gemini-2.5-flash", generation_config=_structured_output(DiseaseIdentification)
+)
+_ENVIRONMENTAL_MODEL = genai.GenerativeModel(
+    "gemini-2.5-flash", generation_config=_structured_output(EnvironmentalFactors)
+)
+_RESEARCH_MODEL = genai.GenerativeModel(
+    "gemini-2.5-flash", generation_config=_structured_output(ResearchFindings)
+)
+_TREATMENT_MODEL = genai.GenerativeModel(
+    "gemini-2.5-flash", generation_config=_structured_output(List[TreatmentOption])
+)
+_FUSED_MODEL = genai.GenerativeModel(
+    "gemini-2.5-flash", generation_config=_structured_output(FusedAnalysis)
+)
+_PREVENTION_MODEL = genai.GenerativeModel(
+    "gemini-2.5-flash",
+    generation_config=_structured_output(List[PreventionStrategy]),
+)
+
+
+def _image_mime_type(image_data: bytes) -> Optional[str]:
+    """MIME type of an image Gemini accepts without conversion, else None."""
+
+    if image_data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if image_data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if image_data[:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+        return "image/webp"
+    if image_data[4:8] == b"ftyp":
+        brand = image_data[8:12]
+        if brand in (b"heic", b"heix"):
+            return "image/heic"
+        if brand in (b"mif1", b"msf1"):
+            return "image/heif"
+    return None
+
+
 class DiseaseIdentificationAgent:
     """Agent responsible for identifying diseases from images and symptoms."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
-        self.vision_model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _IDENTIFICATION_MODEL
+        self.vision_model = _IDENTIFICATION_MODEL
 
     async def analyze_disease(
         self,
@@ -275,18 +743,45 @@ class DiseaseIdentificationAgent:
             prompt = self._build_identification_prompt(symptoms_text, crop_type)
 
             if image_data:
-                # Process image with vision model
-                image = Image.open(io.BytesIO(image_data))
-                response = self.vision_model.generate_content([prompt, image])
-            else:
-                # Text-only analysis
-                response = self.model.generate_content(prompt)
+                # Resubmitted photos (retries, reposts) reuse the earlier result
+                cache_key = (
+                    hashlib.sha256(image_data).hexdigest(),
+                    crop_type,
+                    (symptoms_text or "").strip().lower(),
+                )
+                cached = _IDENTIFICATION_CACHE.get(cache_key)
+                if cached is not None:
+                    return DiseaseIdentification.model_validate_json(cached)
+
+                # Process image with vision model. Formats Gemini accepts are
+                # sent as the uploaded bytes; others are decoded for the SDK
+                # to re-encode.
+                mime_type = _image_mime_type(image_data)
+                if mime_type:
+                    image = {"mime_type": mime_type, "data": image_data}
+                else:
+                    # Pillow is only needed for this path, so import it here
+                    from PIL import Image
+
+                    image = Image.open(io.BytesIO(image_data))
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(
+                    None, self.vision_model.generate_content, [prompt, image]
+                )
+                identification = self._parse_identification_response(
+                    response.text, crop_type
+                )
+                _IDENTIFICATION_CACHE[cache_key] = identification.model_dump_json()
+                return identification
+
+            # Text-only analysis
+            response_text = await generate_text_async(self.model, prompt)
 
             # Parse response and extract disease information
-            return self._parse_identification_response(response.text, crop_type)
+            return self._parse_identification_response(response_text, crop_type)
 
         except Exception as e:
-            logger.error(f"Disease identification failed: {e}")
+            logger.error("Disease identification failed: %s", e)
             return self._create_fallback_identification(crop_type)
 
     def _build_identification_prompt(
@@ -294,65 +789,30 @@ class DiseaseIdentificationAgent:
     ) -> str:
         """Build prompt for disease identification."""
 
-        prompt = f"""
-        You are an expert plant pathologist specializing in crop diseases. Analyze the provided information to identify the disease affecting this {crop_type} crop.
-        
-        """
-
+        # Only the crop and symptoms vary; the instructions are module constants
+        prompt = _IDENTIFICATION_PROMPT_HEADER.format(crop_type=crop_type)
         if symptoms_text:
             prompt += f"Observed symptoms: {symptoms_text}\n\n"
-
-        prompt += """
-        Provide a detailed analysis including:
-        1. Most likely disease name and scientific name of pathogen
-        2. Confidence level (high/medium/low/uncertain) and numerical score (0-1)
-        3. Specific symptoms that led to this identification
-        4. Plant parts affected
-        5. Disease severity assessment
-        
-        Consider common diseases for this crop type and regional factors.
-        Be specific about confidence levels - only use 'high' confidence when symptoms clearly match a specific disease.
-        """
-
-        return prompt
+        return prompt + _IDENTIFICATION_PROMPT_TAIL
 
     def _parse_identification_response(
         self, response_text: str, crop_type: str
     ) -> DiseaseIdentification:
         """Parse the AI response into structured disease identification."""
 
-        # This would typically use structured output, but for now we'll parse text
-        # In production, you'd use Gemini's structured output feature
-
-        return DiseaseIdentification(
-            disease_name="Bacterial Leaf Spot",  # Example - would be parsed from response
-            scientific_name="Xanthomonas campestris",
-            confidence=DiseaseConfidence.MEDIUM,
-            confidence_score=0.75,
-            symptoms_observed=["leaf spots", "yellowing", "wilting"],
-            affected_plant_parts=["leaves", "stems"],
-            severity=SeverityLevel.MODERATE,
-        )
+        return DiseaseIdentification.model_validate_json(response_text)
 
     def _create_fallback_identification(self, crop_type: str) -> DiseaseIdentification:
         """Create fallback identification when analysis fails."""
 
-        return DiseaseIdentification(
-            disease_name="Unknown Disease",
-            scientific_name=None,
-            confidence=DiseaseConfidence.UNCERTAIN,
-            confidence_score=0.1,
-            symptoms_observed=["unspecified symptoms"],
-            affected_plant_parts=["unknown"],
-            severity=SeverityLevel.MILD,
-        )
+        return _FALLBACK_IDENTIFICATION
 
 
 class EnvironmentalAnalysisAgent:
     """Agent for analyzing environmental factors and their correlation with disease."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _ENVIRONMENTAL_MODEL
 
     async def analyze_environmental_factors(
         self,
@@ -368,105 +828,58 @@ class EnvironmentalAnalysisAgent:
             if not weather_data and location:
                 weather_data = self._generate_realistic_weather(location)
 
-            prompt = self._build_environmental_prompt(
+            prompt = self.build_environmental_prompt(
                 soil_data, weather_data, disease_name
             )
-            response = self.model.generate_content(prompt)
+            response_text = await generate_text_async(self.model, prompt)
 
-            return self._parse_environmental_response(response.text)
+            return self._parse_environmental_response(response_text)
 
         except Exception as e:
-            logger.error(f"Environmental analysis failed: {e}")
-            return self._create_fallback_environmental()
+            logger.error("Environmental analysis failed: %s", e)
+            return self.create_fallback_environmental()
 
     def _generate_realistic_weather(self, location: str) -> WeatherData:
         """Generate realistic weather data for major agricultural cities."""
 
-        # Top 10 agricultural cities in India with realistic weather ranges
-        city_weather_patterns = {
-            "bangalore": {
-                "temp_range": (15, 30),
-                "humidity": (60, 80),
-                "rainfall": (5, 150),
-            },
-            "pune": {
-                "temp_range": (18, 35),
-                "humidity": (50, 75),
-                "rainfall": (10, 200),
-            },
-            "hyderabad": {
-                "temp_range": (20, 38),
-                "humidity": (45, 70),
-                "rainfall": (15, 180),
-            },
-            "chennai": {
-                "temp_range": (24, 36),
-                "humidity": (70, 85),
-                "rainfall": (20, 250),
-            },
-            "coimbatore": {
-                "temp_range": (18, 32),
-                "humidity": (65, 80),
-                "rainfall": (25, 300),
-            },
-            "mysore": {
-                "temp_range": (16, 28),
-                "humidity": (60, 85),
-                "rainfall": (30, 200),
-            },
-            "salem": {
-                "temp_range": (20, 35),
-                "humidity": (55, 75),
-                "rainfall": (15, 180),
-            },
-            "madurai": {
-                "temp_range": (22, 38),
-                "humidity": (50, 70),
-                "rainfall": (10, 150),
-            },
-            "tirupur": {
-                "temp_range": (19, 33),
-                "humidity": (60, 80),
-                "rainfall": (20, 220),
-            },
-            "erode": {
-                "temp_range": (21, 36),
-                "humidity": (55, 75),
-                "rainfall": (18, 190),
-            },
-        }
-
         # Default to Bangalore if location not found
         location_key = location.lower() if location else "bangalore"
-        pattern = city_weather_patterns.get(
-            location_key, city_weather_patterns["bangalore"]
-        )
-
-        # Generate realistic values within ranges
-        temp_min = random.uniform(
-            pattern["temp_range"][0], pattern["temp_range"][0] + 5
-        )
-        temp_max = random.uniform(
-            pattern["temp_range"][1] - 5, pattern["temp_range"][1]
+        (
+            temp_low,
+            temp_high,
+            humidity_low,
+            humidity_high,
+            rain_low,
+            rain_high,
+        ) = _CITY_WEATHER_RANGES[_CITY_WEATHER_INDEX.get(location_key, 0)]
+
+        # Seeded on the location and day, so requests for the same city on the
+        # same day see the same weather and share cached environmental analyses
+        rng = np.random.default_rng((date.today().toordinal(), *location_key.encode()))
+
+        # Draw min/max temperature, humidity, rainfall, wind speed and pressure
+        # within their ranges in one call
+        temp_min, temp_max, humidity, rainfall, wind_speed, pressure = (
+            rng.uniform(
+                (temp_low, temp_high - 5, humidity_low, rain_low, 5, 1010),
+                (temp_low + 5, temp_high, humidity_high, rain_high, 25, 1020),
+            )
+            .round(1)
+            .tolist()
         )
-        temp_avg = (temp_min + temp_max) / 2
 
         return WeatherData(
             location=location or "Bangalore",
-            temperature_avg=round(temp_avg, 1),
-            temperature_min=round(temp_min, 1),
-            temperature_max=round(temp_max, 1),
-            humidity=round(
-                random.uniform(pattern["humidity"][0], pattern["humidity"][1]), 1
-            ),
-            rainfall=round(
-                random.uniform(pattern["rainfall"][0], pattern["rainfall"][1]), 1
-            ),
-            wind_speed=round(random.uniform(5, 25), 1),
-            pressure=round(random.uniform(1010, 1020), 1),
+            temperature_avg=round((temp_min + temp_max) / 2, 1),
+            temperature_min=temp_min,
+            temperature_max=temp_max,
+            humidity=humidity,
+            rainfall=rainfall,
+            wind_speed=wind_speed,
+            pressure=pressure,
         )
 
-    def _build_environmental_prompt(
+    def build_environmental_prompt(
         self,
         soil_data: Optional[Dict[str, Any]],
         weather_data: Optional[WeatherData],
@@ -474,73 +887,32 @@ class EnvironmentalAnalysisAgent:
     ) -> str:
         """Build prompt for environmental analysis."""
 
-        prompt = f"""
-        You are an agricultural environmental specialist. Analyze how environmental factors contribute to the development and spread of {disease_name}.
-        
-        """
+        prompt = _ENVIRONMENTAL_PROMPT_HEADER.format(disease_name=disease_name)
 
         if soil_data:
             prompt += f"Soil Data: {soil_data}\n\n"
 
         if weather_data:
-            prompt += f"""
-            Weather Conditions:
-            - Temperature: {weather_data.temperature_min}°C - {weather_data.temperature_max}°C (avg: {weather_data.temperature_avg}°C)
-            - Humidity: {weather_data.humidity}%
-            - Rainfall: {weather_data.rainfall}mm
-            - Wind Speed: {weather_data.wind_speed} km/h
-            
-            """
+            prompt += _ENVIRONMENTAL_PROMPT_WEATHER.format(weather=weather_data)
 
-        prompt += """
-        Analyze and provide:
-        1. How soil pH affects disease development
-        2. Moisture conditions that favor this disease
-        3. Temperature ranges that promote disease
-        4. Humidity impact on disease spread
-        5. Nutrient deficiencies that increase susceptibility
-        6. Other environmental stress factors
-        
-        Be specific about the mechanisms and provide actionable insights.
-        """
-
-        return prompt
+        return prompt + _ENVIRONMENTAL_PROMPT_TAIL
 
     def _parse_environmental_response(self, response_text: str) -> EnvironmentalFactors:
         """Parse environmental analysis response."""
 
-        # Example parsing - in production would use structured output
-        return EnvironmentalFactors(
-            soil_ph_impact="Acidic soil (pH < 6.0) increases disease susceptibility",
-            moisture_conditions="High moisture and poor drainage favor pathogen growth",
-            temperature_range="Optimal disease development at 25-30°C",
-            humidity_impact="High humidity (>80%) promotes spore germination",
-            nutrient_deficiencies=["nitrogen deficiency", "potassium deficiency"],
-            environmental_stress_factors=[
-                "waterlogging",
-                "temperature stress",
-                "poor air circulation",
-            ],
-        )
+        return EnvironmentalFactors.model_validate_json(response_text)
 
-    def _create_fallback_environmental(self) -> EnvironmentalFactors:
+    def create_fallback_environmental(self) -> EnvironmentalFactors:
         """Create fallback environmental analysis."""
 
-        return EnvironmentalFactors(
-            soil_ph_impact="Environmental analysis unavailable",
-            moisture_conditions="Unable to determine moisture impact",
-            temperature_range="Temperature correlation unknown",
-            humidity_impact="Humidity impact unclear",
-            nutrient_deficiencies=[],
-            environmental_stress_factors=[],
-        )
+        return _FALLBACK_ENVIRONMENTAL
 
 
 class ResearchAgent:
     """Agent for conducting deep research using Exa search."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _RESEARCH_MODEL
 
     async def conduct_research(
         self,
@@ -552,7 +924,7 @@ class ResearchAgent:
 
         try:
             # Perform multiple targeted searches
-            research_data = await self._perform_research_searches(
+            research_data = await self.perform_research_searches(
                 disease_name, crop_type
             )
 
@@ -562,79 +934,91 @@ class ResearchAgent:
             )
 
         except Exception as e:
-            logger.error(f"Research failed: {e}")
-            return self._create_fallback_research(disease_name)
+            logger.error("Research failed: %s", e)
+            return self.create_fallback_research(disease_name)
 
-    async def _perform_research_searches(
+    async def perform_research_searches(
         self, disease_name: str, crop_type: str
     ) -> Dict[str, Any]:
         """Perform multiple targeted research searches."""
 
         searches = {
-            "causes": f"{disease_name} {crop_type} causes pathogen lifecycle",
-            "treatment": f"{disease_name} {crop_type} treatment control management",
-            "prevention": f"{disease_name} {crop_type} prevention integrated pest management",
-            "recent_research": f"{disease_name} {crop_type} recent research 2023 2024",
+            search_type: f"{disease_name} {crop_type} {topic}"
+            for search_type, topic in _RESEARCH_SEARCHES
         }
 
-        research_data = {}
-
-        for search_type, query in searches.items():
+        async def _search(search_type: str, query: str) -> List[Dict[str, Any]]:
             try:
-                result = exa_search(
+                result = await exa_search_async(
                     query=query,
                     num_results=5,
-                    include_domains=[
-                        "extension.org",
-                        "icar.org.in",
-                        "fao.org",
-                        "usda.gov",
-                        "agriculture.com",
-                        "researchgate.net",
-                        "springer.com",
-                        "sciencedirect.com",
-                        "wiley.com",
-                        "nature.com",
-                    ],
+                    include_domains=_RESEARCH_DOMAINS,
                     use_autoprompt=True,
                     include_text=True,
                     text_length_limit=1500,
                 )
 
-                if result["status"] == "success":
-                    research_data[search_type] = result["raw_data"]
-                else:
-                    research_data[search_type] = []
+                return result["raw_data"] if result["status"] == "success" else []
 
             except Exception as e:
-                logger.error(f"Search failed for {search_type}: {e}")
-                research_data[search_type] = []
+                logger.error("Search failed for %s: %s", search_type, e)
+                return []
 
-        return research_data
+        # The searches are independent, so issue them concurrently
+        results = await asyncio.gather(
+            *(_search(search_type, query) for search_type, query in searches.items())
+        )
+
+        return dict(zip(searches, results))
 
     async def _synthesize_research(
         self, research_data: Dict[str, Any], disease_name: str, crop_type: str
     ) -> ResearchFindings:
         """Synthesize research findings into structured output."""
 
-        # Combine all research text
-        combined_research = ""
-        sources = []
+        combined_research, sources = self.combine_research(research_data)
+        prompt = self.build_research_prompt(combined_research, disease_name, crop_type)
+
+        try:
+            response_text = await generate_text_async(self.model, prompt)
+            return self._parse_research_response(response_text, sources)
+        except Exception as e:
+            logger.error("Research synthesis failed: %s", e)
+            return self.create_fallback_research(disease_name)
+
+    def combine_research(self, research_data: Dict[str, Any]) -> tuple[str, List[str]]:
+        """Research text up to the prompt budget, and the distinct source URLs."""
+
+        buffer = io.StringIO()
+        remaining = _RESEARCH_TEXT_LIMIT
+        # Insertion-ordered set; the same pages come back from several searches
+        sources: Dict[str, None] = {}
 
         for search_type, results in research_data.items():
             for result in results:
-                combined_research += f"\n--- {search_type.upper()} RESEARCH ---\n"
-                combined_research += f"Title: {result.get('title', 'No title')}\n"
-                combined_research += f"Content: {result.get('text', 'No content')}\n"
-                if result.get("url"):
-                    sources.append(result["url"])
+                if remaining > 0:
+                    chunk = (
+                        f"\n--- {search_type.upper()} RESEARCH ---\n"
+                        f"Title: {result.get('title', 'No title')}\n"
+                        f"Content: {result.get('text', 'No content')}\n"
+                    )
+                    buffer.write(chunk[:remaining])
+                    remaining -= len(chunk)
+                if result.get("url") and len(sources) < _MAX_RESEARCH_SOURCES:
+                    sources[result["url"]] = None
 
-        # Use AI to synthesize findings
-        prompt = f"""
+        return buffer.getvalue(), list(sources)
+
+    def build_research_prompt(
+        self, combined_research: str, disease_name: str, crop_type: str
+    ) -> str:
+        """Build prompt for research synthesis."""
+
+        return f"""
         You are a plant pathology researcher. Synthesize the following research data about {disease_name} affecting {crop_type} crops.
         
         Research Data:
-        {combined_research[:8000]}  # Limit to avoid token limits
+        {combined_research}
         
         Extract and organize:
         1. Primary causes of the disease
@@ -646,51 +1030,20 @@ class ResearchAgent:
         Provide specific, actionable information based on the research.
         """
 
-        try:
-            response = self.model.generate_content(prompt)
-            return self._parse_research_response(response.text, sources)
-        except Exception as e:
-            logger.error(f"Research synthesis failed: {e}")
-            return self._create_fallback_research(disease_name)
-
     def _parse_research_response(
         self, response_text: str, sources: List[str]
     ) -> ResearchFindings:
         """Parse research synthesis response."""
 
-        # Example parsing - in production would use structured output
-        return ResearchFindings(
-            disease_causes=[
-                "fungal pathogen",
-                "environmental stress",
-                "poor sanitation",
-            ],
-            pathogen_lifecycle="Pathogen overwinters in soil debris, spreads through water splash",
-            spread_mechanisms=[
-                "water splash",
-                "wind dispersal",
-                "contaminated tools",
-                "infected seeds",
-            ],
-            host_range=["tomato", "pepper", "eggplant", "potato"],
-            research_sources=sources[:10],  # Limit sources
-            recent_developments=[
-                "new resistant varieties",
-                "biological control agents",
-                "precision application methods",
-            ],
-        )
+        findings = ResearchFindings.model_validate_json(response_text)
+        # Cite the searched URLs rather than whatever sources the model lists
+        return findings.model_copy(update={"research_sources": sources})
 
-    def _create_fallback_research(self, disease_name: str) -> ResearchFindings:
+    def create_fallback_research(self, disease_name: str) -> ResearchFindings:
         """Create fallback research findings."""
 
-        return ResearchFindings(
-            disease_causes=[f"Unknown causes for {disease_name}"],
-            pathogen_lifecycle=None,
-            spread_mechanisms=["unknown transmission"],
-            host_range=[],
-            research_sources=[],
-            recent_developments=[],
+        return _FALLBACK_RESEARCH.model_copy(
+            update={"disease_causes": [f"Unknown causes for {disease_name}"]}
         )
 
 
@@ -698,7 +1051,7 @@ class TreatmentRecommendationAgent:
     """Agent for generating treatment recommendations."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _TREATMENT_MODEL
 
     async def generate_treatment_recommendations(
         self,
@@ -711,7 +1064,7 @@ class TreatmentRecommendationAgent:
 
         try:
             # Search for specific treatment information
-            treatment_data = await self._search_treatment_options(
+            treatment_data = await self.search_treatment_options(
                 disease_name, crop_type
             )
 
@@ -721,30 +1074,21 @@ class TreatmentRecommendationAgent:
             )
 
         except Exception as e:
-            logger.error(f"Treatment recommendation failed: {e}")
-            return self._create_fallback_treatments(disease_name, severity)
+            logger.error("Treatment recommendation failed: %s", e)
+            return self.create_fallback_treatments(disease_name, severity)
 
-    async def _search_treatment_options(
+    async def search_treatment_options(
         self, disease_name: str, crop_type: str
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """Search for treatment options."""
 
         query = f"{disease_name} {crop_type} treatment fungicide bactericide control products"
 
         try:
-            result = exa_search(
+            result = await exa_search_async(
                 query=query,
                 num_results=8,
-                include_domains=[
-                    "extension.org",
-                    "icar.org.in",
-                    "agriculture.gov.in",
-                    "bayer.com",
-                    "syngenta.com",
-                    "corteva.com",
-                    "agritech.tnau.ac.in",
-                    "krishijagran.com",
-                ],
+                include_domains=_TREATMENT_DOMAINS,
                 use_autoprompt=True,
                 include_text=True,
                 text_length_limit=1200,
@@ -753,7 +1097,7 @@ class TreatmentRecommendationAgent:
             return result.get("raw_data", []) if result["status"] == "success" else []
 
         except Exception as e:
-            logger.error(f"Treatment search failed: {e}")
+            logger.error("Treatment search failed: %s", e)
             return []
 
     async def _synthesize_treatments(
@@ -766,20 +1110,56 @@ class TreatmentRecommendationAgent:
     ) -> List[TreatmentOption]:
         """Synthesize treatment options from research and search data."""
 
-        # Combine treatment research
-        treatment_text = ""
+        prompt = self.build_treatment_prompt(
+            disease_name,
+            crop_type,
+            severity,
+            str(research_findings.disease_causes),
+            self.combine_treatment_data(treatment_data),
+        )
+
+        try:
+            response_text = await generate_text_async(self.model, prompt)
+            return self._parse_treatment_response(response_text, severity)
+        except Exception as e:
+            logger.error("Treatment synthesis failed: %s", e)
+            return self.create_fallback_treatments(disease_name, severity)
+
+    def combine_treatment_data(self, treatment_data: List[Dict[str, Any]]) -> str:
+        """Treatment search text up to the prompt budget."""
+
+        buffer = io.StringIO()
+        remaining = _TREATMENT_TEXT_LIMIT
         for data in treatment_data:
-            treatment_text += f"Title: {data.get('title', '')}\n"
-            treatment_text += f"Content: {data.get('text', '')}\n\n"
+            if remaining <= 0:
+                break
+            chunk = (
+                f"Title: {data.get('title', '')}\n"
+                f"Content: {data.get('text', '')}\n\n"
+            )
+            buffer.write(chunk[:remaining])
+            remaining -= len(chunk)
 
-        prompt = f"""
+        return buffer.getvalue()
+
+    def build_treatment_prompt(
+        self,
+        disease_name: str,
+        crop_type: str,
+        severity: SeverityLevel,
+        disease_causes: str,
+        treatment_text: str,
+    ) -> str:
+        """Build prompt for treatment recommendations."""
+
+        return f"""
         You are an agricultural extension specialist. Based on the research data, recommend specific treatments for {disease_name} affecting {crop_type} crops.
         
         Disease Severity: {severity}
-        Research Findings: {research_findings.disease_causes}
+        Research Findings: {disease_causes}
         
         Treatment Research Data:
-        {treatment_text[:6000]}
+        {treatment_text}
         
         Provide 3-5 treatment options including:
         1. Chemical treatments (fungicides/bactericides)
@@ -796,108 +1176,120 @@ class TreatmentRecommendationAgent:
         - Effectiveness and precautions
         """
 
-        try:
-            response = self.model.generate_content(prompt)
-            return self._parse_treatment_response(response.text, severity)
-        except Exception as e:
-            logger.error(f"Treatment synthesis failed: {e}")
-            return self._create_fallback_treatments(disease_name, severity)
-
     def _parse_treatment_response(
         self, response_text: str, severity: SeverityLevel
     ) -> List[TreatmentOption]:
         """Parse treatment recommendations response."""
 
-        # Example treatments - in production would parse from AI response
-        treatments = [
-            TreatmentOption(
-                treatment_name="Copper-based Fungicide",
-                treatment_type=TreatmentType.CHEMICAL,
-                active_ingredients=["copper sulfate", "copper hydroxide"],
-                application_method="Foliar spray",
-                dosage="2-3 grams per liter of water",
-                frequency="Every 7-10 days",
-                timing="Early morning or evening",
-                cost_estimate="₹200-300 per acre",
-                availability="Local agricultural stores, online retailers",
-                effectiveness=0.8,
-                side_effects=[
-                    "may cause leaf burn if overused",
-                    "avoid during flowering",
-                ],
-            ),
-            TreatmentOption(
-                treatment_name="Trichoderma Biological Control",
-                treatment_type=TreatmentType.BIOLOGICAL,
-                active_ingredients=["Trichoderma viride", "Trichoderma harzianum"],
-                application_method="Soil application and foliar spray",
-                dosage="5-10 grams per liter for spray, 1 kg per acre for soil",
-                frequency="Every 15 days",
-                timing="Before disease onset, preventive application",
-                cost_estimate="₹150-250 per acre",
-                availability="Bio-fertilizer dealers, ICAR centers",
-                effectiveness=0.7,
-                side_effects=[
-                    "no known side effects",
-                    "compatible with organic farming",
-                ],
-            ),
-            TreatmentOption(
-                treatment_name="Cultural Management",
-                treatment_type=TreatmentType.CULTURAL,
-                active_ingredients=["improved sanitation", "crop rotation"],
-                application_method="Field management practices",
-                dosage="Complete implementation",
-                frequency="Continuous",
-                timing="Throughout growing season",
-                cost_estimate="₹50-100 per acre (labor cost)",
-                availability="Farmer implementation",
-                effectiveness=0.6,
-                side_effects=["requires additional labor", "long-term benefits"],
-            ),
-        ]
-
-        # Adjust effectiveness based on severity
-        severity_multiplier = {
-            SeverityLevel.MILD: 1.0,
-            SeverityLevel.MODERATE: 0.9,
-            SeverityLevel.SEVERE: 0.8,
-            SeverityLevel.CRITICAL: 0.7,
-        }
+        return self.adjust_for_severity(
+            _TREATMENT_OPTIONS.validate_json(response_text), severity
+        )
 
-        multiplier = severity_multiplier.get(severity, 0.8)
-        for treatment in treatments:
-            treatment.effectiveness *= multiplier
+    def adjust_for_severity(
+        self, treatments: List[TreatmentOption], severity: SeverityLevel
+    ) -> List[TreatmentOption]:
+        """Scale treatment effectiveness down for more severe infections."""
 
-        return treatments
+        # Adjust effectiveness based on severity
+        multiplier = _SEVERITY_MULTIPLIER.get(severity, 0.8)
+        return [
+            treatment.model_copy(
+                update={"effectiveness": treatment.effectiveness * multiplier}
+            )
+            for treatment in treatments
+        ]
 
-    def _create_fallback_treatments(
+    def create_fallback_treatments(
         self, disease_name: str, severity: SeverityLevel
     ) -> List[TreatmentOption]:
         """Create fallback treatment options."""
 
-        return [
-            TreatmentOption(
-                treatment_name="General Fungicide Treatment",
-                treatment_type=TreatmentType.CHEMICAL,
-                active_ingredients=["broad spectrum fungicide"],
-                application_method="Foliar spray",
-                dosage="As per manufacturer instructions",
-                frequency="Weekly",
-                timing="Early morning",
-                cost_estimate="₹200-400 per acre",
-                availability="Local agricultural stores",
-                effectiveness=0.6,
-                side_effects=["follow safety guidelines"],
+        return list(_FALLBACK_TREATMENTS)
+
+
+class FusedAnalysisAgent:
+    """
+    Agent that runs the environmental, research and treatment analyses as one
+    Gemini call over shared disease context.
+
+    The prompt sections come from the individual agents, which remain
+    available for callers that need a single analysis.
+    """
+
+    def __init__(
+        self,
+        environmental_agent: EnvironmentalAnalysisAgent,
+        research_agent: ResearchAgent,
+        treatment_agent: TreatmentRecommendationAgent,
+    ):
+        self.model = _FUSED_MODEL
+        self.environmental_agent = environmental_agent
+        self.research_agent = research_agent
+        self.treatment_agent = treatment_agent
+
+    async def analyze(
+        self,
+        disease_identification: DiseaseIdentification,
+        crop_type: str,
+        research_data: Dict[str, Any],
+        treatment_data: List[Dict[str, Any]],
+        soil_data: Optional[Dict[str, Any]] = None,
+        weather_data: Optional[WeatherData] = None,
+    ) -> tuple[EnvironmentalFactors, ResearchFindings, List[TreatmentOption]]:
+        """Analyze environmental factors, research and treatments together."""
+
+        disease_name = disease_identification.disease_name
+        severity = disease_identification.severity
+        combined_research, sources = self.research_agent.combine_research(research_data)
+
+        prompt = "\n".join(
+            (
+                "Complete the three sections below. Answer with one JSON object "
+                'holding section 1 as "environmental", section 2 as "research" '
+                'and section 3 as "treatments".',
+                "SECTION 1: ENVIRONMENTAL ANALYSIS",
+                self.environmental_agent.build_environmental_prompt(
+                    soil_data, weather_data, disease_name
+                ),
+                "SECTION 2: RESEARCH SYNTHESIS",
+                self.research_agent.build_research_prompt(
+                    combined_research, disease_name, crop_type
+                ),
+                "SECTION 3: TREATMENT RECOMMENDATIONS",
+                self.treatment_agent.build_treatment_prompt(
+                    disease_name,
+                    crop_type,
+                    severity,
+                    "the primary causes from section 2",
+                    self.treatment_agent.combine_treatment_data(treatment_data),
+                ),
             )
-        ]
+        )
+
+        try:
+            response_text = await generate_text_async(self.model, prompt)
+            analysis = FusedAnalysis.model_validate_json(response_text)
+        except Exception as e:
+            logger.error("Fused analysis failed: %s", e)
+            return (
+                self.environmental_agent.create_fallback_environmental(),
+                self.research_agent.create_fallback_research(disease_name),
+                self.treatment_agent.create_fallback_treatments(disease_name, severity),
+            )
+
+        return (
+            analysis.environmental,
+            # Cite the searched URLs rather than whatever sources the model lists
+            analysis.research.model_copy(update={"research_sources": sources}),
+            self.treatment_agent.adjust_for_severity(analysis.treatments, severity),
+        )
 
 
 class YieldImpactAnalysisAgent:
     """Agent for analyzing yield impact and economic implications."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
 
     async def analyze_yield_impact(
         self,
@@ -906,12 +1298,20 @@ class YieldImpactAnalysisAgent:
         severity: SeverityLevel,
         environmental_factors: EnvironmentalFactors,
         treatment_available: bool = True,
+        yield_search: Optional[Awaitable[List[Dict[str, Any]]]] = None,
     ) -> YieldImpact:
-        """Analyze potential yield impact and economic implications."""
+        """
+        Analyze potential yield impact and economic implications.
+
+        ``yield_search`` is an already started yield data search; when not
+        given, the search is run here.
+        """
 
         try:
             # Search for yield loss data
-            yield_data = await self._search_yield_impact_data(disease_name, crop_type)
+            if yield_search is None:
+                yield_search = self.search_yield_impact_data(disease_name, crop_type)
+            yield_data = await yield_search
 
             # Calculate impact based on severity and factors
             return await self._calculate_yield_impact(
@@ -924,10 +1324,10 @@ class YieldImpactAnalysisAgent:
             )
 
         except Exception as e:
-            logger.error(f"Yield impact analysis failed: {e}")
+            logger.error("Yield impact analysis failed: %s", e)
             return self._create_fallback_yield_impact(severity)
 
-    async def _search_yield_impact_data(
+    async def search_yield_impact_data(
         self, disease_name: str, crop_type: str
     ) -> List[Dict[str, Any]]:
         """Search for yield impact data."""
@@ -937,17 +1337,10 @@ class YieldImpactAnalysisAgent:
         )
 
         try:
-            result = exa_search(
+            result = await exa_search_async(
                 query=query,
                 num_results=5,
-                include_domains=[
-                    "fao.org",
-                    "icar.org.in",
-                    "agriculture.gov.in",
-                    "researchgate.net",
-                    "springer.com",
-                    "extension.org",
-                ],
+                include_domains=_YIELD_IMPACT_DOMAINS,
                 use_autoprompt=True,
                 include_text=True,
                 text_length_limit=1000,
@@ -956,7 +1349,7 @@ class YieldImpactAnalysisAgent:
             return result.get("raw_data", []) if result["status"] == "success" else []
 
         except Exception as e:
-            logger.error(f"Yield impact search failed: {e}")
+            logger.error("Yield impact search failed: %s", e)
             return []
 
     async def _calculate_yield_impact(
@@ -970,15 +1363,8 @@ class YieldImpactAnalysisAgent:
     ) -> YieldImpact:
         """Calculate yield impact based on multiple factors."""
 
-        # Base yield loss percentages by severity
-        base_yield_loss = {
-            SeverityLevel.MILD: 5.0,
-            SeverityLevel.MODERATE: 15.0,
-            SeverityLevel.SEVERE: 35.0,
-            SeverityLevel.CRITICAL: 60.0,
-        }
-
-        potential_loss = base_yield_loss.get(severity, 20.0)
+        # Base yield loss percentage by severity
+        potential_loss = _BASE_YIELD_LOSS.get(severity, 20.0)
 
         # Adjust based on environmental factors
         if len(environmental_factors.environmental_stress_factors) > 2:
@@ -1026,14 +1412,7 @@ class YieldImpactAnalysisAgent:
     def _assess_quality_impact(self, severity: SeverityLevel) -> str:
         """Assess impact on crop quality."""
 
-        quality_impacts = {
-            SeverityLevel.MILD: "Minimal impact on crop quality. Marketable produce expected.",
-            SeverityLevel.MODERATE: "Some reduction in crop quality. May affect premium pricing.",
-            SeverityLevel.SEVERE: "Significant quality degradation. Reduced market value expected.",
-            SeverityLevel.CRITICAL: "Severe quality loss. Crop may be unsuitable for premium markets.",
-        }
-
-        return quality_impacts.get(severity, "Quality impact assessment unavailable.")
+        return _QUALITY_IMPACTS.get(severity, "Quality impact assessment unavailable.")
 
     def _assess_market_value_impact(self, yield_loss: float) -> str:
         """Assess market value impact."""
@@ -1050,14 +1429,7 @@ class YieldImpactAnalysisAgent:
     ) -> str:
         """Estimate recovery timeline."""
 
-        base_timelines = {
-            SeverityLevel.MILD: "1-2 weeks with treatment",
-            SeverityLevel.MODERATE: "3-4 weeks with treatment",
-            SeverityLevel.SEVERE: "6-8 weeks with intensive treatment",
-            SeverityLevel.CRITICAL: "Full season may be lost, focus on next season",
-        }
-
-        timeline = base_timelines.get(severity, "Timeline uncertain")
+        timeline = _BASE_TIMELINES.get(severity, "Timeline uncertain")
 
         if not treatment_available:
             timeline += " (extended without proper treatment)"
@@ -1067,15 +1439,8 @@ class YieldImpactAnalysisAgent:
     def _create_fallback_yield_impact(self, severity: SeverityLevel) -> YieldImpact:
         """Create fallback yield impact analysis."""
 
-        base_loss = {
-            SeverityLevel.MILD: 10.0,
-            SeverityLevel.MODERATE: 20.0,
-            SeverityLevel.SEVERE: 40.0,
-            SeverityLevel.CRITICAL: 65.0,
-        }
-
         return YieldImpact(
-            potential_yield_loss=base_loss.get(severity, 25.0),
+            potential_yield_loss=_FALLBACK_YIELD_LOSS.get(severity, 25.0),
             economic_impact="Economic impact analysis unavailable",
             quality_impact="Quality impact assessment unavailable",
             market_value_impact=None,
@@ -1088,7 +1453,7 @@ class DailyLogTodoIntegrationAgent:
     """Agent for integrating disease analysis with daily logs and todo tasks."""
 
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
 
     async def create_daily_log_entry(
         self,
@@ -1111,38 +1476,41 @@ class DailyLogTodoIntegrationAgent:
                 "yield_impact": disease_report.yield_impact.potential_yield_loss,
             }
 
-            # Create daily log entry
-            daily_log = DailyLog(
-                crop_id=crop_id,
-                log_date=date.today(),
-                activity_type="disease_analysis",
-                activity_details=activity_details,
-                notes=f"Disease analysis conducted: {disease_report.disease_identification.disease_name}. "
-                f"Confidence: {disease_report.disease_identification.confidence}. "
-                f"Potential yield loss: {disease_report.yield_impact.potential_yield_loss}%.",
-                crop_health_observation=disease_report.disease_identification.severity,
-                crop_health_notes=f"Symptoms: {', '.join(disease_report.disease_identification.symptoms_observed)}",
-                diseases_noted=disease_report.disease_identification.disease_name,
-                disease_spotted=True,
-                ai_insights=disease_report.executive_summary,
-                ai_recommendations=disease_report.immediate_actions
-                + disease_report.long_term_recommendations,
-                images=[f"disease_analysis_{disease_report.analysis_id}.jpg"]
-                if image_data
-                else [],
+            # Create daily log entry; RETURNING hands back the new ID
+            daily_log_id = db.scalar(
+                insert(DailyLog)
+                .values(
+                    crop_id=crop_id,
+                    log_date=date.today(),
+                    activity_type="disease_analysis",
+                    activity_details=activity_details,
+                    notes=f"Disease analysis conducted: {disease_report.disease_identification.disease_name}. "
+                    f"Confidence: {disease_report.disease_identification.confidence}. "
+                    f"Potential yield loss: {disease_report.yield_impact.potential_yield_loss}%.",
+                    crop_health_observation=disease_report.disease_identification.severity,
+                    crop_health_notes=f"Symptoms: {', '.join(disease_report.disease_identification.symptoms_observed)}",
+                    diseases_noted=disease_report.disease_identification.disease_name,
+                    disease_spotted=True,
+                    ai_insights=disease_report.executive_summary,
+                    ai_recommendations=disease_report.immediate_actions
+                    + disease_report.long_term_recommendations,
+                    images=[f"disease_analysis_{disease_report.analysis_id}.jpg"]
+                    if image_data
+                    else [],
+                )
+                .returning(DailyLog.id)
             )
-
-            db.add(daily_log)
             db.commit()
-            db.refresh(daily_log)
 
             logger.info(
-                f"Created daily log entry {daily_log.id} for disease analysis {disease_report.analysis_id}"
+                "Created daily log entry %s for disease analysis %s",
+                daily_log_id,
+                disease_report.analysis_id,
             )
-            return daily_log.id
+            return daily_log_id
 
         except Exception as e:
-            logger.error(f"Failed to create daily log entry: {e}")
+            logger.error("Failed to create daily log entry: %s", e)
             db.rollback()
             return None
 
@@ -1155,68 +1523,77 @@ class DailyLogTodoIntegrationAgent:
     ) -> List[int]:
         """Create todo tasks based on disease analysis recommendations."""
 
-        created_todo_ids = []
+        if (
+            disease_report.confidence_overall < _MIN_TODO_CONFIDENCE
+            or not disease_report.treatment_options
+        ):
+            logger.info(
+                "Skipping todos for analysis %s: low confidence or no treatments",
+                disease_report.analysis_id,
+            )
+            return []
+
+        # Due dates are the same for every todo of a kind
+        today = date.today()
+        due_tomorrow = today + timedelta(days=1)
+        due_in_2_days = today + timedelta(days=2)
+        due_in_3_days = today + timedelta(days=3)
+        due_in_a_week = today + timedelta(days=7)
+
+        todos: List[Dict[str, Any]] = []
 
         try:
             # Create immediate action todos
             for i, action in enumerate(
                 disease_report.immediate_actions[:5], 1
             ):  # Limit to 5 immediate actions
-                todo = TodoTask(
+                todo = dict(
                     user_id=user_id,
                     crop_id=crop_id,
-                    task_title=f"Immediate Action {i}: {action[:50]}{'...' if len(action) > 50 else ''}",
+                    task_title=f"Immediate Action {i}: {_ellipsize(action, 50)}",
                     task_description=action,
                     priority="high",
                     status="pending",
-                    due_date=date.today() + timedelta(days=1),  # Due tomorrow
+                    due_date=due_tomorrow,
                     is_system_generated=True,
                     ai_generated=True,
                 )
 
-                db.add(todo)
-                db.commit()
-                db.refresh(todo)
-                created_todo_ids.append(todo.id)
-                logger.info(
-                    f"Created immediate action todo {todo.id}: {action[:30]}..."
-                )
+                todos.append(todo)
 
             # Create treatment todos
             for i, treatment in enumerate(
                 disease_report.treatment_options[:3], 1
             ):  # Limit to 3 treatments
-                todo = TodoTask(
+                todo = dict(
                     user_id=user_id,
                     crop_id=crop_id,
                     task_title=f"Apply {treatment.treatment_name}",
-                    task_description=f"Treatment: {treatment.treatment_name}\n"
-                    f"Method: {treatment.application_method}\n"
-                    f"Dosage: {treatment.dosage}\n"
-                    f"Frequency: {treatment.frequency}\n"
-                    f"Timing: {treatment.timing}\n"
-                    f"Cost: {treatment.cost_estimate}\n"
-                    f"Where to get: {treatment.availability}",
+                    task_description="\n".join(
+                        (
+                            f"Treatment: {treatment.treatment_name}",
+                            f"Method: {treatment.application_method}",
+                            f"Dosage: {treatment.dosage}",
+                            f"Frequency: {treatment.frequency}",
+                            f"Timing: {treatment.timing}",
+                            f"Cost: {treatment.cost_estimate}",
+                            f"Where to get: {treatment.availability}",
+                        )
+                    ),
                     priority="high" if treatment.effectiveness > 0.7 else "medium",
                     status="pending",
-                    due_date=date.today() + timedelta(days=2),  # Due in 2 days
+                    due_date=due_in_2_days,
                     is_system_generated=True,
                     ai_generated=True,
                 )
 
-                db.add(todo)
-                db.commit()
-                db.refresh(todo)
-                created_todo_ids.append(todo.id)
-                logger.info(
-                    f"Created treatment todo {todo.id}: {treatment.treatment_name}"
-                )
+                todos.append(todo)
 
             # Create prevention todos for long-term
             for i, prevention in enumerate(
                 disease_report.prevention_strategies[:3], 1
             ):  # Limit to 3 strategies
-                todo = TodoTask(
+                todo = dict(
                     user_id=user_id,
                     crop_id=crop_id,
                     task_title=f"Implement {prevention.strategy_name}",
@@ -1227,21 +1604,15 @@ class DailyLogTodoIntegrationAgent:
                     f"Cost: {prevention.cost}",
                     priority="medium",
                     status="pending",
-                    due_date=date.today() + timedelta(days=7),  # Due in a week
+                    due_date=due_in_a_week,
                     is_system_generated=True,
                     ai_generated=True,
                 )
 
-                db.add(todo)
-                db.commit()
-                db.refresh(todo)
-                created_todo_ids.append(todo.id)
-                logger.info(
-                    f"Created prevention todo {todo.id}: {prevention.strategy_name}"
-                )
+                todos.append(todo)
 
             # Create monitoring todo
-            monitoring_todo = TodoTask(
+            monitoring_todo = dict(
                 user_id=user_id,
                 crop_id=crop_id,
                 task_title="Monitor Disease Progress",
@@ -1251,7 +1622,7 @@ class DailyLogTodoIntegrationAgent:
                 f"Take photos and update daily logs.",
                 priority="medium",
                 status="pending",
-                due_date=date.today() + timedelta(days=3),  # Due in 3 days
+                due_date=due_in_3_days,
                 is_system_generated=True,
                 ai_generated=True,
                 is_recurring=True,
@@ -1259,18 +1630,28 @@ class DailyLogTodoIntegrationAgent:
                 recurrence_interval=1,
             )
 
-            db.add(monitoring_todo)
+            todos.append(monitoring_todo)
+
+            # Bulk INSERT in one transaction; RETURNING hands back the IDs
+            created_todo_ids = list(
+                db.scalars(
+                    insert(TodoTask).returning(TodoTask.id),
+                    todos,
+                )
+            )
             db.commit()
-            db.refresh(monitoring_todo)
-            created_todo_ids.append(monitoring_todo.id)
-            logger.info(f"Created monitoring todo {monitoring_todo.id}")
 
+            logger.info(
+                "Created %s todos for disease analysis %s",
+                len(created_todo_ids),
+                disease_report.analysis_id,
+            )
             return created_todo_ids
 
         except Exception as e:
-            logger.error(f"Failed to create todo tasks: {e}")
+            logger.error("Failed to create todo tasks: %s", e)
             db.rollback()
-            return created_todo_ids  # Return what was created before the error
+            return []  # The todos are created together or not at all
 
 
 class CropDiseaseResearchOrchestrator:
@@ -1281,9 +1662,13 @@ class CropDiseaseResearchOrchestrator:
         self.environmental_agent = EnvironmentalAnalysisAgent()
         self.research_agent = ResearchAgent()
         self.treatment_agent = TreatmentRecommendationAgent()
+        self.fused_agent = FusedAnalysisAgent(
+            self.environmental_agent, self.research_agent, self.treatment_agent
+        )
         self.yield_agent = YieldImpactAnalysisAgent()
         self.integration_agent = DailyLogTodoIntegrationAgent()
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = _GEMINI_FLASH
+        self.prevention_model = _PREVENTION_MODEL
 
     async def conduct_deep_research(
         self,
@@ -1314,8 +1699,9 @@ class CropDiseaseResearchOrchestrator:
         """
 
         analysis_id = f"disease_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        logger.info(f"Starting comprehensive disease analysis: {analysis_id}")
+        logger.info("Starting comprehensive disease analysis: %s", analysis_id)
 
+        yield_search: Optional[asyncio.Task] = None
         try:
             # Step 1: Disease Identification
             logger.info("Step 1: Identifying disease...")
@@ -1323,54 +1709,63 @@ class CropDiseaseResearchOrchestrator:
                 image_data=image_data, symptoms_text=symptoms_text, crop_type=crop_type
             )
 
-            # Step 2: Environmental Analysis
-            logger.info("Step 2: Analyzing environmental factors...")
-            environmental_analysis = (
-                await self.environmental_agent.analyze_environmental_factors(
-                    soil_data=soil_data,
-                    weather_data=weather_data,
-                    disease_name=disease_identification.disease_name,
-                    location=location,
-                )
-            )
-
-            # Generate weather data if not provided
+            # Generate weather data if not provided, once, so the report shows
+            # the same conditions the environmental analysis used
             if not weather_data and location:
                 weather_data = self.environmental_agent._generate_realistic_weather(
                     location
                 )
 
-            # Step 3: Research Findings
-            logger.info("Step 3: Conducting deep research...")
-            research_findings = await self.research_agent.conduct_research(
-                disease_name=disease_identification.disease_name, crop_type=crop_type
-            )
-
-            # Step 4: Treatment Recommendations
-            logger.info("Step 4: Generating treatment recommendations...")
-            treatment_options = (
-                await self.treatment_agent.generate_treatment_recommendations(
-                    disease_name=disease_identification.disease_name,
-                    crop_type=crop_type,
-                    severity=disease_identification.severity,
-                    research_findings=research_findings,
+            # The searches only need the disease. The yield data is not needed
+            # until step 5, so its search also overlaps the analysis call.
+            yield_search = asyncio.create_task(
+                self.yield_agent.search_yield_impact_data(
+                    disease_identification.disease_name, crop_type
                 )
             )
+            logger.info("Step 2: Searching research and treatment sources...")
+            research_data, treatment_data = await asyncio.gather(
+                self.research_agent.perform_research_searches(
+                    disease_identification.disease_name, crop_type
+                ),
+                self.treatment_agent.search_treatment_options(
+                    disease_identification.disease_name, crop_type
+                ),
+            )
 
-            # Step 5: Yield Impact Analysis
-            logger.info("Step 5: Analyzing yield impact...")
-            yield_impact = await self.yield_agent.analyze_yield_impact(
-                disease_name=disease_identification.disease_name,
-                crop_type=crop_type,
-                severity=disease_identification.severity,
-                environmental_factors=environmental_analysis,
-                treatment_available=len(treatment_options) > 0,
+            # Steps 3-4: environmental, research and treatment analysis share
+            # the disease context, so they are one Gemini call
+            logger.info("Steps 3-4: Analyzing environment, research and treatments...")
+            (
+                environmental_analysis,
+                research_findings,
+                treatment_options,
+            ) = await self.fused_agent.analyze(
+                disease_identification,
+                crop_type,
+                research_data,
+                treatment_data,
+                soil_data=soil_data,
+                weather_data=weather_data,
             )
 
-            # Step 6: Generate Prevention Strategies
+            # Steps 5 and 6 are independent of each other
+            logger.info("Step 5: Analyzing yield impact...")
             logger.info("Step 6: Generating prevention strategies...")
-            prevention_strategies = await self._generate_prevention_strategies(
-                disease_identification, environmental_analysis, research_findings
+            yield_impact, prevention_strategies = await asyncio.gather(
+                self.yield_agent.analyze_yield_impact(
+                    disease_name=disease_identification.disease_name,
+                    crop_type=crop_type,
+                    severity=disease_identification.severity,
+                    environmental_factors=environmental_analysis,
+                    treatment_available=len(treatment_options) > 0,
+                    yield_search=yield_search,
+                ),
+                self._generate_prevention_strategies(
+                    disease_identification,
+                    environmental_analysis,
+                    research_findings,
+                ),
             )
 
             # Step 7: Create Executive Summary and Recommendations
@@ -1438,22 +1833,30 @@ class CropDiseaseResearchOrchestrator:
                     )
 
                     logger.info(
-                        f"Integration completed: daily_log_id={daily_log_id}, todo_count={len(todo_ids)}"
+                        "Integration completed: daily_log_id=%s, todo_count=%s",
+                        daily_log_id,
+                        len(todo_ids),
                     )
 
                 except Exception as e:
-                    logger.error(f"Integration failed: {e}")
+                    logger.error("Integration failed: %s", e)
                     report.integration_status = "failed"
 
-            logger.info(f"Comprehensive disease analysis completed: {analysis_id}")
+            logger.info("Comprehensive disease analysis completed: %s", analysis_id)
             return report
 
         except Exception as e:
-            logger.error(f"Comprehensive analysis failed: {e}")
+            logger.error("Comprehensive analysis failed: %s", e)
             return await self._create_fallback_report(
                 analysis_id, crop_type, location, str(e)
             )
 
+        finally:
+            # A step before the yield analysis failed (or this call was
+            # cancelled); don't leave the yield search running detached
+            if yield_search is not None:
+                yield_search.cancel()
+
     async def _generate_prevention_strategies(
         self,
         disease_identification: DiseaseIdentification,
@@ -1462,36 +1865,17 @@ class CropDiseaseResearchOrchestrator:
     ) -> List[PreventionStrategy]:
         """Generate prevention strategies based on analysis."""
 
-        prompt = f"""
-        Based on the disease analysis, generate 3-5 prevention strategies for {disease_identification.disease_name}.
-        
-        Disease Information:
-        - Disease: {disease_identification.disease_name}
-        - Severity: {disease_identification.severity}
-        - Affected parts: {disease_identification.affected_plant_parts}
-        
-        Environmental Factors:
-        - Soil pH impact: {environmental_analysis.soil_ph_impact}
-        - Moisture conditions: {environmental_analysis.moisture_conditions}
-        - Stress factors: {environmental_analysis.environmental_stress_factors}
-        
-        Research Findings:
-        - Spread mechanisms: {research_findings.spread_mechanisms}
-        - Disease causes: {research_findings.disease_causes}
-        
-        Provide specific, actionable prevention strategies including:
-        1. Cultural practices
-        2. Sanitation measures
-        3. Resistant varieties
-        4. Environmental management
-        5. Monitoring protocols
-        """
+        prompt = _PREVENTION_PROMPT.format(
+            identification=disease_identification,
+            environmental=environmental_analysis,
+            research=research_findings,
+        )
 
         try:
-            response = self.model.generate_content(prompt)
-            return self._parse_prevention_strategies(response.text)
+            response_text = await generate_text_async(self.prevention_model, prompt)
+            return self._parse_prevention_strategies(response_text)
         except Exception as e:
-            logger.error(f"Prevention strategy generation failed: {e}")
+            logger.error("Prevention strategy generation failed: %s", e)
             return self._create_fallback_prevention_strategies()
 
     def _parse_prevention_strategies(
@@ -1499,66 +1883,12 @@ class CropDiseaseResearchOrchestrator:
     ) -> List[PreventionStrategy]:
         """Parse prevention strategies from AI response."""
 
-        # Example strategies - in production would parse from AI response
-        return [
-            PreventionStrategy(
-                strategy_name="Crop Rotation",
-                description="Implement 3-4 year crop rotation with non-host crops to break disease cycle",
-                implementation_steps=[
-                    "Plan rotation sequence with cereals or legumes",
-                    "Avoid planting susceptible crops in same field",
-                    "Maintain rotation records",
-                    "Monitor soil health during rotation",
-                ],
-                timing="Plan before next planting season",
-                cost="₹500-1000 per acre (planning and implementation)",
-                effectiveness=0.8,
-            ),
-            PreventionStrategy(
-                strategy_name="Sanitation Practices",
-                description="Implement strict field sanitation to reduce pathogen load",
-                implementation_steps=[
-                    "Remove and destroy infected plant debris",
-                    "Clean tools between fields",
-                    "Use certified disease-free seeds",
-                    "Disinfect equipment regularly",
-                ],
-                timing="Continuous throughout season",
-                cost="₹200-400 per acre (labor and materials)",
-                effectiveness=0.7,
-            ),
-            PreventionStrategy(
-                strategy_name="Water Management",
-                description="Optimize irrigation to reduce disease-favorable conditions",
-                implementation_steps=[
-                    "Install drip irrigation system",
-                    "Avoid overhead watering",
-                    "Improve field drainage",
-                    "Monitor soil moisture levels",
-                ],
-                timing="Before planting and throughout season",
-                cost="₹2000-5000 per acre (infrastructure)",
-                effectiveness=0.75,
-            ),
-        ]
+        return _PREVENTION_STRATEGIES.validate_json(response_text)
 
     def _create_fallback_prevention_strategies(self) -> List[PreventionStrategy]:
         """Create fallback prevention strategies."""
 
-        return [
-            PreventionStrategy(
-                strategy_name="General Sanitation",
-                description="Maintain good field hygiene and sanitation practices",
-                implementation_steps=[
-                    "Remove infected plant material",
-                    "Clean farming tools",
-                    "Use healthy seeds",
-                ],
-                timing="Throughout growing season",
-                cost="₹300-500 per acre",
-                effectiveness=0.6,
-            )
-        ]
+        return list(_FALLBACK_PREVENTION_STRATEGIES)
 
     async def _generate_summary_and_recommendations(
         self,
@@ -1590,12 +1920,12 @@ class CropDiseaseResearchOrchestrator:
         """
 
         try:
-            response = self.model.generate_content(prompt)
+            response_text = await generate_text_async(self.model, prompt)
             return self._parse_summary_and_recommendations(
-                response.text, disease_identification, yield_impact
+                response_text, disease_identification, yield_impact
             )
         except Exception as e:
-            logger.error(f"Summary generation failed: {e}")
+            logger.error("Summary generation failed: %s", e)
             return self._create_fallback_summary_and_recommendations(
                 disease_identification, yield_impact
             )
@@ -1701,80 +2031,15 @@ class CropDiseaseResearchOrchestrator:
     ) -> ComprehensiveDiseaseReport:
         """Create fallback report when analysis fails."""
 
-        fallback_disease = DiseaseIdentification(
-            disease_name="Unknown Disease",
-            scientific_name=None,
-            confidence=DiseaseConfidence.UNCERTAIN,
-            confidence_score=0.1,
-            symptoms_observed=["analysis failed"],
-            affected_plant_parts=["unknown"],
-            severity=SeverityLevel.MILD,
-        )
-
-        fallback_environmental = EnvironmentalFactors()
-
-        fallback_research = ResearchFindings(
-            disease_causes=["analysis incomplete"],
-            pathogen_lifecycle=None,
-            spread_mechanisms=["unknown"],
-            host_range=[],
-            research_sources=[],
-            recent_developments=[],
-        )
-
-        fallback_treatment = TreatmentOption(
-            treatment_name="Consult Expert",
-            treatment_type=TreatmentType.CULTURAL,
-            active_ingredients=["professional consultation"],
-            application_method="Contact agricultural extension",
-            dosage="As recommended by expert",
-            frequency="As needed",
-            timing="Immediately",
-            cost_estimate="Consultation fees",
-            availability="Local agricultural office",
-            effectiveness=0.5,
-            side_effects=[],
-        )
-
-        fallback_prevention = PreventionStrategy(
-            strategy_name="General Best Practices",
-            description="Follow general agricultural best practices",
-            implementation_steps=["Maintain field hygiene", "Monitor crops regularly"],
-            timing="Continuous",
-            cost="Variable",
-            effectiveness=0.5,
-        )
-
-        fallback_yield = YieldImpact(
-            potential_yield_loss=20.0,
-            economic_impact="Impact assessment unavailable due to analysis failure",
-            quality_impact="Quality impact unknown",
-            market_value_impact=None,
-            recovery_timeline="Consult expert for timeline",
-            mitigation_potential=0.5,
-        )
-
-        return ComprehensiveDiseaseReport(
-            analysis_id=analysis_id,
-            crop_type=crop_type,
-            location=location,
-            disease_identification=fallback_disease,
-            environmental_analysis=fallback_environmental,
-            weather_correlation=None,
-            research_findings=fallback_research,
-            treatment_options=[fallback_treatment],
-            prevention_strategies=[fallback_prevention],
-            yield_impact=fallback_yield,
-            executive_summary=f"Analysis failed due to technical issues: {error_message}. Please consult local agricultural experts for proper diagnosis and treatment recommendations.",
-            immediate_actions=[
-                "Contact local agricultural extension officer",
-                "Implement basic sanitation measures",
-            ],
-            long_term_recommendations=[
-                "Establish regular monitoring protocols",
-                "Consider professional consultation",
-            ],
-            confidence_overall=0.1,
+        return _FALLBACK_REPORT.model_copy(
+            update={
+                "analysis_id": analysis_id,
+                "timestamp": datetime.now(),
+                "crop_type": crop_type,
+                "location": location,
+                "executive_summary": f"Analysis failed due to technical issues: {error_message}. Please consult local agricultural experts for proper diagnosis and treatment recommendations.",
+            },
+            deep=True,
         )
 
 
@@ -1828,15 +2093,15 @@ async def deep_research_disease_analysis(
             create_logs_and_todos=create_logs_and_todos,
         )
 
-        # Convert to dictionary for API response
+        # JSON-native dump for the API response and report storage
         return {
             "status": "success",
             "analysis_id": report.analysis_id,
-            "report": report.dict(),
+            "report": report.model_dump(mode="json"),
         }
 
     except Exception as e:
-        logger.error(f"Deep research analysis failed: {e}")
+        logger.error("Deep research analysis failed: %s", e)
         return {
             "status": "error",
             "error_message": f"Analysis failed: {str(e)}",
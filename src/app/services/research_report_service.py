@@ -250,7 +250,7 @@ class ResearchReportService:
                 time_period=viz_data.get("time_period"),
                 chart_data={},  # Could store raw data if needed
                 image_base64=viz_data.get("image_base64", ""),
-                image_format="png",
+                image_format=viz_data.get("image_format", "png"),
                 display_order=i,
             )
             self.db.add(visualization)
@@ -4,17 +4,41 @@ Exa Search Tool for Agricultural Assistant
 Provides Exa AI-powered search functionality for enhanced agricultural research and information.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import orjson
+from cachetools import TTLCache
 from exa_py import Exa
 from app.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# Exa results are stable within a few hours and repeat across farmers, so
+# successful responses are cached keyed on the full search arguments (and
+# also written to EXA_CACHE_DIR, when set, to survive restarts). Entries are
+# the orjson-encoded result, so every caller decodes its own copy.
+_EXA_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=settings.EXA_CACHE_TTL_SECONDS)
+_EXA_INFLIGHT: Dict[Tuple, asyncio.Future] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _exa_client(api_key: str) -> Exa:
+    """Exa client shared by every search made with ``api_key``."""
+    return Exa(api_key=api_key)
+
 
 def exa_search(
     query: str,
     num_results: int = 10,
-    include_domains: Optional[List[str]] = None,
-    exclude_domains: Optional[List[str]] = None,
+    include_domains: Optional[Sequence[str]] = None,
+    exclude_domains: Optional[Sequence[str]] = None,
     start_crawl_date: Optional[str] = None,
     end_crawl_date: Optional[str] = None,
     start_published_date: Optional[str] = None,
@@ -32,8 +56,8 @@ def exa_search(
     Args:
         query (str): The search query string
         num_results (int): Number of results to return (default: 10, max: 100)
-        include_domains (List[str], optional): Domains to include in search
-        exclude_domains (List[str], optional): Domains to exclude from search
+        include_domains (Sequence[str], optional): Domains to include in search
+        exclude_domains (Sequence[str], optional): Domains to exclude from search
         start_crawl_date (str, optional): Start date for crawl filter (YYYY-MM-DD)
         end_crawl_date (str, optional): End date for crawl filter (YYYY-MM-DD)
         start_published_date (str, optional): Start date for published filter (YYYY-MM-DD)
@@ -56,17 +80,17 @@ def exa_search(
         }
 
     try:
-        logging.info(f"Performing Exa search with query: {query}")
+        logger.info("Performing Exa search with query: %s", query)
 
-        # Initialize Exa client
-        exa = Exa(api_key=exa_api_key)
+        exa = _exa_client(exa_api_key)
 
         # Perform search with content
         search_response = exa.search_and_contents(
             query=query,
             num_results=min(num_results, 100),
-            include_domains=include_domains,
-            exclude_domains=exclude_domains,
+            # The client only accepts lists for the domain filters
+            include_domains=list(include_domains) if include_domains else None,
+            exclude_domains=list(exclude_domains) if exclude_domains else None,
             start_crawl_date=start_crawl_date,
             end_crawl_date=end_crawl_date,
             start_published_date=start_published_date,
@@ -135,10 +159,129 @@ def exa_search(
         }
 
     except Exception as e:
-        logging.error(f"Exa search failed: {str(e)}")
+        logger.error("Exa search failed: %s", e)
         return {"status": "error", "error_message": f"Exa search failed: {str(e)}"}
 
 
+def _exa_search_persistent(key: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Blocking ``exa_search`` backed by the optional on-disk cache."""
+
+    path = None
+    if settings.EXA_CACHE_DIR:
+        digest = hashlib.sha256(orjson.dumps(key, default=str)).hexdigest()
+        path = Path(settings.EXA_CACHE_DIR) / f"{digest}.json"
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age < settings.EXA_CACHE_TTL_SECONDS:
+                return orjson.loads(path.read_bytes())
+            path.unlink(missing_ok=True)
+        except (OSError, ValueError):
+            pass
+
+    result = exa_search(**kwargs)
+
+    if path is not None and result.get("status") == "success":
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(result))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Failed to persist Exa result: %s", e)
+        else:
+            _prune_exa_cache_dir(path.parent)
+
+    return result
+
+
+def _prune_exa_cache_dir(directory: Path) -> None:
+    """
+    Delete expired entries from the on-disk cache, then the oldest ones
+    beyond ``EXA_CACHE_MAX_ENTRIES``.
+    """
+
+    entries = []
+    now = time.time()
+    for entry in directory.glob("*.json"):
+        try:
+            mtime = entry.stat().st_mtime
+            if now - mtime >= settings.EXA_CACHE_TTL_SECONDS:
+                entry.unlink(missing_ok=True)
+            else:
+                entries.append((mtime, entry))
+        except OSError:
+            pass
+
+    excess = len(entries) - settings.EXA_CACHE_MAX_ENTRIES
+    if excess > 0:
+        entries.sort()
+        for _, entry in entries[:excess]:
+            try:
+                entry.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def _finish_exa_search(key: Tuple, future: asyncio.Future) -> None:
+    """Drop a finished search from ``_EXA_INFLIGHT`` and cache it on success."""
+
+    _EXA_INFLIGHT.pop(key, None)
+    if future.cancelled() or future.exception() is not None:
+        return
+
+    result = future.result()
+    if result.get("status") == "success":
+        _EXA_CACHE[key] = orjson.dumps(result)
+
+
+def _exa_cache_value(name: str, value: Any) -> Any:
+    """Hashable form of an ``exa_search`` argument for the cache key."""
+
+    if name == "query":
+        # Queries differing only in case or spacing share results, e.g. the
+        # same disease named "Leaf Blast" and "leaf blast" by two farmers
+        return " ".join(value.lower().split())
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+async def exa_search_async(**kwargs) -> Dict[str, Any]:
+    """
+    Run the blocking ``exa_search`` call in a worker thread.
+
+    Successful results are served from a TTL cache; concurrent callers for the
+    same search share the one in-flight request instead of repeating it. Each
+    caller gets its own copy of the result, free to modify.
+
+    Args:
+        **kwargs: Keyword arguments for ``exa_search``
+
+    Returns:
+        Dict[str, Any]: Search results as returned by ``exa_search``
+    """
+    key = tuple(
+        sorted((name, _exa_cache_value(name, value)) for name, value in kwargs.items())
+    )
+
+    cached = _EXA_CACHE.get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    future = _EXA_INFLIGHT.get(key)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            None, functools.partial(_exa_search_persistent, key, kwargs)
+        )
+        _EXA_INFLIGHT[key] = future
+        future.add_done_callback(functools.partial(_finish_exa_search, key))
+
+    # Shielded so one cancelled caller does not cancel the search for the rest
+    result = await asyncio.shield(future)
+    return orjson.loads(orjson.dumps(result))
+
+
 def exa_search_agricultural(query: str) -> Dict[str, Any]:
     """
     Performs an Exa search specifically optimized for agricultural content.
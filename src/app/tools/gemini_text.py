@@ -0,0 +1,53 @@
+"""
+Gemini Text Generation
+
+Cached, non-blocking ``generate_content`` shared by the deep research agents.
+"""
+
+import asyncio
+import functools
+import hashlib
+
+import google.generativeai as genai
+from cachetools import TTLCache
+
+# Gemini responses keyed on the model's full configuration and the exact
+# prompt. Text prompts repeat for the same crop, symptoms and disease, or the
+# same farm and market figures. Image prompts are not cached.
+_GEMINI_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=7 * 24 * 3600)
+
+
+@functools.lru_cache(maxsize=32)
+def _model_fingerprint(model: genai.GenerativeModel) -> str:
+    """
+    Digest of everything that shapes a model's response besides the prompt.
+
+    Models sharing a name differ in generation config (response schema,
+    MIME type), system instruction, tools and safety settings; the repr
+    covers them all. Models are module-level singletons, so this is computed
+    once per model.
+    """
+    return hashlib.sha256(repr(model).encode()).hexdigest()
+
+
+async def generate_text_async(model: genai.GenerativeModel, prompt: str) -> str:
+    """
+    Run ``generate_content`` in a worker thread, caching the response text.
+
+    Args:
+        model: Configured Gemini model
+        prompt: Text prompt
+
+    Returns:
+        The response text
+    """
+    key = hashlib.sha256(f"{_model_fingerprint(model)}\n{prompt}".encode()).hexdigest()
+    cached = _GEMINI_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(None, model.generate_content, prompt)
+    text = response.text
+    _GEMINI_CACHE[key] = text
+    return text
@@ -11,8 +11,14 @@ from typing import Any, Dict
 from decimal import Decimal
 from enum import Enum
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# orjson handles datetime, date and Enum natively; non-string keys are
+# stringified like the stdlib encoder does
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects and other non-serializable types."""
@@ -35,6 +41,18 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Convert the types orjson cannot serialize, mirroring DateTimeEncoder."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    elif hasattr(obj, "__dict__"):
+        # Handle Pydantic models and other objects with __dict__
+        return obj.__dict__
+    elif hasattr(obj, "dict") and callable(obj.dict):
+        return obj.dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 def serialize_for_json(data: Any) -> Dict[str, Any]:
     """
     Serialize complex data structures for JSON storage.
@@ -46,9 +64,9 @@ def serialize_for_json(data: Any) -> Dict[str, Any]:
         Dict that can be safely serialized to JSON
     """
     try:
-        # Convert to JSON string and back to dict to handle all serialization
-        json_string = json.dumps(data, cls=DateTimeEncoder, ensure_ascii=False)
-        return json.loads(json_string)
+        # Convert to JSON bytes and back to dict to handle all serialization
+        json_bytes = orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS)
+        return orjson.loads(json_bytes)
     except Exception as e:
         logger.error(f"Failed to serialize data for JSON: {e}")
         # Fallback: try to convert manually
@@ -103,7 +121,12 @@ def safe_json_dumps(data: Any, **kwargs) -> str:
         JSON string
     """
     try:
-        return json.dumps(data, cls=DateTimeEncoder, ensure_ascii=False, **kwargs)
+        if kwargs:
+            # Formatting options are only understood by the stdlib encoder
+            return json.dumps(data, cls=DateTimeEncoder, ensure_ascii=False, **kwargs)
+        return orjson.dumps(
+            data, default=_orjson_default, option=_ORJSON_OPTIONS
+        ).decode("utf-8")
     except Exception as e:
         logger.error(f"Failed to dump JSON: {e}")
         # Fallback with manual serialization
@@ -122,7 +145,7 @@ def safe_json_loads(json_string: str) -> Any:
         Parsed data or None if parsing fails
     """
     try:
-        return json.loads(json_string)
+        return orjson.loads(json_string)
     except Exception as e:
         logger.error(f"Failed to load JSON: {e}")
         return None
@@ -139,30 +162,10 @@ def clean_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
         Cleaned report data safe for JSON storage
     """
     try:
-        # Use the serialization function to clean the data
-        cleaned_data = serialize_for_json(report_data)
-
-        # Additional cleaning for specific known issues
-        if isinstance(cleaned_data, dict):
-            # Handle timestamp field specifically
-            if "timestamp" in cleaned_data and isinstance(
-                cleaned_data["timestamp"], datetime
-            ):
-                cleaned_data["timestamp"] = cleaned_data["timestamp"].isoformat()
-
-            # Recursively clean nested dictionaries
-            for key, value in cleaned_data.items():
-                if isinstance(value, dict):
-                    cleaned_data[key] = clean_report_data(value)
-                elif isinstance(value, list):
-                    cleaned_data[key] = [
-                        clean_report_data(item)
-                        if isinstance(item, dict)
-                        else _manual_serialize(item)
-                        for item in value
-                    ]
-
-        return cleaned_data
+        # serialize_for_json already returns JSON-native values for the whole
+        # tree (datetimes as ISO strings, enums as values), so nested dicts do
+        # not need another pass
+        return serialize_for_json(report_data)
 
     except Exception as e:
         logger.error(f"Failed to clean report data: {e}")
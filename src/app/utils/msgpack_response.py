@@ -0,0 +1,39 @@
+"""
+MessagePack Response Utilities
+
+Content negotiation helpers that let internal workers request list endpoints
+as ``application/msgpack`` instead of JSON.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Type
+
+import ormsgpack
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def wants_msgpack(request: Request) -> bool:
+    """Dependency that reports whether the client accepts MessagePack."""
+    return MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def msgpack_response(rows: Iterable[Any], schema: Type[BaseModel]) -> Response:
+    """
+    Encode ORM rows through a response schema as a MessagePack response.
+
+    Args:
+        rows: ORM objects to serialize
+        schema: Pydantic response schema (must allow ``from_attributes``)
+
+    Returns:
+        Response with the packed payload
+    """
+    payload = ormsgpack.packb(
+        [schema.model_validate(row) for row in rows],
+        option=ormsgpack.OPT_SERIALIZE_PYDANTIC,
+    )
+    return Response(content=payload, media_type=MSGPACK_MEDIA_TYPE)
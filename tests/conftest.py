@@ -0,0 +1,58 @@
+"""Shared fixtures: an in-memory SQLite database with one farmer and crop."""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import orjson
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.config.database import Base, _json_serializer
+from app.models.crop import Crop
+from app.models.user import User
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory database, configured like the app engine."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def farmer(db):
+    user = User(name="Test Farmer", email="farmer@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def crop(db, farmer):
+    crop = Crop(user_id=farmer.id, crop_name="Rice", latitude=12.97, longitude=77.59)
+    db.add(crop)
+    db.commit()
+    return crop
@@ -0,0 +1,69 @@
+"""SQL aggregation of daily log costs in the cost analysis agent."""
+
+from datetime import date, timedelta
+
+from app.models.daily_log import DailyLog
+from app.services.deep_research.business_intelligence_research import (
+    CostAnalysisAgent,
+)
+
+
+def _log(crop, costs, days_ago=0):
+    return DailyLog(
+        crop_id=crop.id,
+        log_date=date.today() - timedelta(days=days_ago),
+        activity_details={"costs": costs},
+    )
+
+
+def test_costs_are_summed_per_category(db, farmer, crop):
+    db.add_all(
+        [
+            _log(crop, {"seeds": 100, "labor": 20.5}),
+            _log(crop, {"seeds": 50.0, "fertilizer": 30}),
+        ]
+    )
+    db.commit()
+
+    costs = CostAnalysisAgent()._extract_cost_data(farmer.id, ["Rice"], 6, db)
+
+    assert costs["seeds"] == 150.0
+    assert costs["labor"] == 20.5
+    assert costs["fertilizer"] == 30.0
+    assert costs["storage"] == 0.0
+
+
+def test_non_numeric_costs_are_skipped(db, farmer, crop):
+    db.add_all(
+        [_log(crop, {"seeds": "7"}) for _ in range(5)]
+        + [
+            _log(crop, {"seeds": "N/A", "labor": ""}),
+            _log(crop, {"seeds": None, "labor": [1, 2], "pesticide": {"a": 1}}),
+            _log(crop, {"seeds": 12, "labor": 3, "bogus": 99}),
+        ]
+    )
+    db.add(DailyLog(crop_id=crop.id, activity_details={"costs": "none"}))
+    db.add(DailyLog(crop_id=crop.id, activity_details=None))
+    db.commit()
+
+    costs = CostAnalysisAgent()._extract_cost_data(farmer.id, ["Rice"], 6, db)
+
+    assert costs["seeds"] == 12.0
+    assert costs["labor"] == 3.0
+    assert costs["pesticide"] == 0.0
+    assert "bogus" not in costs
+
+
+def test_costs_are_filtered_by_crop_and_date(db, farmer, crop):
+    db.add_all(
+        [
+            _log(crop, {"seeds": 10}),
+            _log(crop, {"seeds": 1000}, days_ago=400),
+        ]
+    )
+    db.commit()
+    agent = CostAnalysisAgent()
+
+    assert agent._extract_cost_data(farmer.id, ["Rice"], 6, db)["seeds"] == 10.0
+    assert agent._extract_cost_data(farmer.id, ["all"], 6, db)["seeds"] == 10.0
+    assert agent._extract_cost_data(farmer.id, ["Maize"], 6, db)["seeds"] == 0.0
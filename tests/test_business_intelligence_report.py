@@ -0,0 +1,22 @@
+"""Fallback report of the business intelligence orchestrator."""
+
+from app.services.deep_research.business_intelligence_research import (
+    _FALLBACK_REPORT,
+    BusinessIntelligenceOrchestrator,
+)
+
+
+async def test_fallback_reports_do_not_share_lists():
+    orchestrator = BusinessIntelligenceOrchestrator()
+    first = await orchestrator._create_fallback_report("b1", 1, ["Rice"], "boom")
+    second = await orchestrator._create_fallback_report("b2", 1, ["Rice"], "boom")
+
+    first.immediate_actions.append("leaked")
+    first.strategic_initiatives.append("leaked")
+    first.todo_ids.append(1)
+
+    for report in (second, _FALLBACK_REPORT):
+        assert "leaked" not in report.immediate_actions
+        assert "leaked" not in report.strategic_initiatives
+        assert report.todo_ids == []
+    assert second.analysis_id == "b2"
@@ -0,0 +1,160 @@
+"""Fallback reports and todo integration of the disease research pipeline."""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.models.daily_log import DailyLog
+from app.models.todo import TodoTask
+from app.services.deep_research.deep_research_diseaase import (
+    _FALLBACK_REPORT,
+    CropDiseaseResearchOrchestrator,
+    DailyLogTodoIntegrationAgent,
+)
+
+
+@pytest.fixture
+def report():
+    """A report confident enough to get todos: 2 actions, 1 treatment, 1 strategy."""
+    return _FALLBACK_REPORT.model_copy(
+        update={"analysis_id": "r1", "confidence_overall": 0.8}, deep=True
+    )
+
+
+async def test_fallback_reports_do_not_share_lists():
+    orchestrator = CropDiseaseResearchOrchestrator()
+    first = await orchestrator._create_fallback_report("a1", "rice", None, "boom")
+    second = await orchestrator._create_fallback_report("a2", "rice", None, "boom")
+
+    first.immediate_actions.append("leaked")
+    first.long_term_recommendations.append("leaked")
+    first.treatment_options.clear()
+    first.todo_ids.append(1)
+
+    for report in (second, _FALLBACK_REPORT):
+        assert "leaked" not in report.immediate_actions
+        assert "leaked" not in report.long_term_recommendations
+        assert report.treatment_options
+        assert report.todo_ids == []
+    assert second.analysis_id == "a2"
+
+
+async def test_todo_ids_match_the_created_rows(db, farmer, crop, report):
+    ids = await DailyLogTodoIntegrationAgent().create_todo_tasks(
+        farmer.id, crop.id, report, db
+    )
+
+    todos = db.scalars(select(TodoTask).order_by(TodoTask.id)).all()
+    assert sorted(ids) == [todo.id for todo in todos]
+    assert len(todos) == 5
+    by_title = {todo.task_title: todo for todo in todos}
+    today = date.today()
+    assert by_title[
+        "Immediate Action 1: Contact local agricultural extension officer"
+    ].due_date == today + timedelta(days=1)
+    assert by_title["Apply Consult Expert"].due_date == today + timedelta(days=2)
+    assert by_title["Implement General Best Practices"].due_date == today + timedelta(
+        days=7
+    )
+    monitoring = by_title["Monitor Disease Progress"]
+    assert monitoring.is_recurring and monitoring.recurrence_pattern == "weekly"
+    assert all(todo.user_id == farmer.id and todo.ai_generated for todo in todos)
+    assert all(todo.created_at is not None for todo in todos)
+
+
+async def test_todo_creation_is_all_or_nothing(db, farmer, crop, report):
+    inserts = []
+
+    def fail_second_insert(conn, cursor, statement, parameters, context, many):
+        if statement.startswith("INSERT INTO todo_tasks"):
+            inserts.append(statement)
+            if len(inserts) == 2:
+                raise RuntimeError("disk full")
+
+    event.listen(db.get_bind(), "before_cursor_execute", fail_second_insert)
+    ids = await DailyLogTodoIntegrationAgent().create_todo_tasks(
+        farmer.id, crop.id, report, db
+    )
+    event.remove(db.get_bind(), "before_cursor_execute", fail_second_insert)
+
+    assert len(inserts) == 2
+    assert ids == []
+    assert db.scalar(select(func.count()).select_from(TodoTask)) == 0
+
+
+async def test_low_confidence_reports_get_no_todos(db, farmer, crop, report):
+    agent = DailyLogTodoIntegrationAgent()
+    low_confidence = report.model_copy(update={"confidence_overall": 0.29})
+    untreated = report.model_copy(update={"treatment_options": []})
+
+    assert await agent.create_todo_tasks(farmer.id, crop.id, low_confidence, db) == []
+    assert await agent.create_todo_tasks(farmer.id, crop.id, untreated, db) == []
+    assert db.scalar(select(func.count()).select_from(TodoTask)) == 0
+
+
+async def test_daily_log_entry_returns_the_new_id(db, farmer, crop, report):
+    log_id = await DailyLogTodoIntegrationAgent().create_daily_log_entry(
+        farmer.id, crop.id, report, db, image_data=b"jpeg"
+    )
+
+    log = db.get(DailyLog, log_id)
+    assert log is not None
+    assert log.log_date == date.today()
+    assert log.activity_type == "disease_analysis"
+    assert log.activity_details["analysis_id"] == "r1"
+    assert log.activity_details["confidence"] == "uncertain"
+    assert log.images == ["disease_analysis_r1.jpg"]
+
+
+async def test_daily_log_entry_failure_returns_none(db, farmer, report):
+    log_id = await DailyLogTodoIntegrationAgent().create_daily_log_entry(
+        farmer.id, 999, report, db
+    )
+
+    assert log_id is None
+    assert db.scalar(select(func.count()).select_from(DailyLog)) == 0
+
+
+async def test_failed_analysis_cancels_the_yield_search(monkeypatch):
+    orchestrator = CropDiseaseResearchOrchestrator()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def identify(**kwargs):
+        return _FALLBACK_REPORT.disease_identification
+
+    async def slow_yield_search(disease_name, crop_type):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def searches(disease_name, crop_type):
+        await started.wait()
+        return []
+
+    async def fail(*args, **kwargs):
+        raise RuntimeError("analysis failed")
+
+    monkeypatch.setattr(orchestrator.disease_agent, "analyze_disease", identify)
+    monkeypatch.setattr(
+        orchestrator.yield_agent, "search_yield_impact_data", slow_yield_search
+    )
+    monkeypatch.setattr(
+        orchestrator.research_agent, "perform_research_searches", searches
+    )
+    monkeypatch.setattr(
+        orchestrator.treatment_agent, "search_treatment_options", searches
+    )
+    monkeypatch.setattr(orchestrator.fused_agent, "analyze", fail)
+
+    report = await orchestrator.conduct_deep_research(
+        symptoms_text="yellow leaves", crop_type="rice"
+    )
+
+    assert "analysis failed" in report.executive_summary
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
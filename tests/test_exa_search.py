@@ -0,0 +1,112 @@
+"""Caching and request coalescing in ``exa_search_async``."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.config.settings import settings
+from app.tools import exa_search as exa
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    """Record each blocking search instead of calling Exa."""
+    calls = []
+
+    def fake_search(**kwargs):
+        calls.append(kwargs)
+        time.sleep(0.05)
+        if kwargs["query"] == "fail":
+            return {"status": "error", "error_message": "boom"}
+        return {"status": "success", "raw_data": [{"url": "https://example.org"}]}
+
+    monkeypatch.setattr(exa, "exa_search", fake_search)
+    monkeypatch.setattr(exa, "_EXA_CACHE", {})
+    monkeypatch.setattr(exa, "_EXA_INFLIGHT", {})
+    monkeypatch.setattr(settings, "EXA_CACHE_DIR", None)
+    return calls
+
+
+async def test_concurrent_searches_are_coalesced(searches):
+    results = await asyncio.gather(
+        *(exa.exa_search_async(query="Leaf Blast", num_results=3) for _ in range(3))
+    )
+
+    assert len(searches) == 1
+    assert all(result["status"] == "success" for result in results)
+
+
+async def test_results_are_cached_ignoring_query_case_and_spacing(searches):
+    await exa.exa_search_async(query="Leaf Blast", include_domains=("a.org",))
+    await exa.exa_search_async(query="  leaf   blast", include_domains=["a.org"])
+    await exa.exa_search_async(query="leaf blast", include_domains=["b.org"])
+
+    assert len(searches) == 2
+
+
+async def test_callers_get_independent_copies(searches):
+    coalesced = await asyncio.gather(
+        exa.exa_search_async(query="rice"), exa.exa_search_async(query="rice")
+    )
+    coalesced[0]["raw_data"].append({"url": "mutated"})
+    coalesced[0]["status"] = "mutated"
+    cached = await exa.exa_search_async(query="rice")
+
+    assert coalesced[1]["raw_data"] == [{"url": "https://example.org"}]
+    assert cached == {
+        "status": "success",
+        "raw_data": [{"url": "https://example.org"}],
+    }
+
+
+async def test_failed_searches_are_not_cached(searches):
+    await exa.exa_search_async(query="fail")
+    await exa.exa_search_async(query="fail")
+
+    assert len(searches) == 2
+
+
+@pytest.fixture
+def cache_dir(searches, monkeypatch, tmp_path):
+    """Persist results to a temporary directory, 60 second TTL."""
+    monkeypatch.setattr(settings, "EXA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "EXA_CACHE_TTL_SECONDS", 60)
+    return tmp_path
+
+
+def _age(path, seconds):
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_stale_disk_entries_are_deleted(searches, cache_dir):
+    exa._exa_search_persistent(("q",), {"query": "q"})
+    (entry,) = cache_dir.glob("*.json")
+
+    exa._exa_search_persistent(("q",), {"query": "q"})
+    assert len(searches) == 1
+
+    # The refetch fails, so nothing rewrites the stale entry
+    _age(entry, 120)
+    result = exa._exa_search_persistent(("q",), {"query": "fail"})
+    assert result["status"] == "error"
+    assert not entry.exists()
+
+
+def test_disk_cache_drops_expired_and_oldest_entries(searches, cache_dir, monkeypatch):
+    monkeypatch.setattr(settings, "EXA_CACHE_MAX_ENTRIES", 2)
+    expired = cache_dir / "expired.json"
+    oldest = cache_dir / "oldest.json"
+    recent = cache_dir / "recent.json"
+    for path, age in ((expired, 120), (oldest, 30), (recent, 10)):
+        path.write_bytes(b"{}")
+        _age(path, age)
+
+    exa._exa_search_persistent(("q",), {"query": "q"})
+
+    remaining = set(cache_dir.glob("*.json"))
+    assert len(remaining) == 2
+    assert recent in remaining
+    assert not expired.exists() and not oldest.exists()
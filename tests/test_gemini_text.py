@@ -0,0 +1,46 @@
+"""Response caching in the shared Gemini text helper."""
+
+from types import SimpleNamespace
+
+import google.generativeai as genai
+
+from app.tools import gemini_text
+
+
+def _model(calls, **kwargs):
+    model = genai.GenerativeModel("gemini-2.5-flash", **kwargs)
+
+    def generate_content(prompt):
+        calls.append((model, prompt))
+        return SimpleNamespace(text=f"response {len(calls)}")
+
+    model.generate_content = generate_content
+    return model
+
+
+async def test_identical_requests_are_cached(monkeypatch):
+    monkeypatch.setattr(gemini_text, "_GEMINI_CACHE", {})
+    calls = []
+    model = _model(calls)
+
+    first = await gemini_text.generate_text_async(model, "prompt")
+    second = await gemini_text.generate_text_async(model, "prompt")
+    other = await gemini_text.generate_text_async(model, "other prompt")
+
+    assert first == second == "response 1"
+    assert other == "response 2"
+    assert len(calls) == 2
+
+
+async def test_models_sharing_a_name_do_not_share_responses(monkeypatch):
+    monkeypatch.setattr(gemini_text, "_GEMINI_CACHE", {})
+    calls = []
+    plain = _model(calls)
+    structured = _model(
+        calls,
+        generation_config=genai.GenerationConfig(response_mime_type="application/json"),
+    )
+
+    assert await gemini_text.generate_text_async(plain, "prompt") == "response 1"
+    assert await gemini_text.generate_text_async(structured, "prompt") == "response 2"
+    assert [model for model, _ in calls] == [plain, structured]
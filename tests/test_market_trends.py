@@ -0,0 +1,87 @@
+"""Trend direction and volatility thresholds of the market trend agent."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.models.consumer_price import ConsumerPrice
+from app.services.deep_research.business_intelligence_research import (
+    _FALLBACK_MARKET_ANALYSIS,
+    MarketTrendAnalysisAgent,
+    RiskLevel,
+    TrendDirection,
+)
+
+
+@pytest.fixture
+def agent():
+    return MarketTrendAnalysisAgent()
+
+
+@pytest.mark.parametrize(
+    ("second_half", "expected"),
+    [
+        (95.0, TrendDirection.STABLE),  # exactly -5%
+        (94.99, TrendDirection.DECREASING),
+        (100.0, TrendDirection.STABLE),
+        (105.0, TrendDirection.STABLE),  # exactly +5%
+        (105.01, TrendDirection.INCREASING),
+    ],
+)
+def test_trend_direction_edges(agent, second_half, expected):
+    prices = np.array([100.0, 100.0, second_half, second_half])
+
+    assert agent._calculate_trend_direction(prices) == expected
+
+
+def test_trend_of_a_single_price_is_stable(agent):
+    assert agent._calculate_trend_direction(np.array([42.0])) == TrendDirection.STABLE
+
+
+def test_erratic_prices_are_volatile(agent):
+    prices = np.array([80.0, 120.0] * 10)
+
+    assert agent._calculate_trend_direction(prices) == TrendDirection.VOLATILE
+
+
+@pytest.mark.parametrize(
+    ("prices", "expected"),
+    [
+        # Fewer than ten prices are too few to judge
+        (np.full(9, 100.0), RiskLevel.MEDIUM),
+        (np.full(10, 100.0), RiskLevel.LOW),
+        (np.array([90.0, 110.0] * 5), RiskLevel.MEDIUM),  # CV ~10.5%
+        (np.array([91.0, 109.0] * 5), RiskLevel.LOW),  # CV ~9.5%
+        (np.array([80.0, 120.0] * 5), RiskLevel.HIGH),  # CV ~21%
+        (np.array([82.0, 118.0] * 5), RiskLevel.MEDIUM),  # CV ~19%
+        (np.zeros(10), RiskLevel.LOW),
+    ],
+)
+def test_volatility_edges(agent, prices, expected):
+    assert agent._assess_volatility(prices) == expected
+
+
+async def test_price_trends_from_stored_prices(db, agent):
+    # Two markets a day, rising steadily over the last 120 days
+    today = date.today()
+    db.add_all(
+        ConsumerPrice(
+            price_date=today - timedelta(days=day),
+            crop_type="Rice",
+            price_per_kg=20.0 + (119 - day) * 0.1 + offset,
+            market_location=market,
+        )
+        for day in range(120)
+        for market, offset in (("Mysore", -0.5), ("Mandya", 0.5))
+    )
+    db.commit()
+
+    price_data = agent._get_historical_prices(["Rice"], db)
+    analysis = await agent._analyze_price_trends(price_data, {})
+
+    assert analysis is not _FALLBACK_MARKET_ANALYSIS
+    assert analysis.current_price == pytest.approx(30.45)
+    assert analysis.price_trend_30_days == TrendDirection.INCREASING
+    assert analysis.price_trend_90_days == TrendDirection.INCREASING
+    assert analysis.market_volatility == RiskLevel.MEDIUM
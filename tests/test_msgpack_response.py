@@ -0,0 +1,72 @@
+"""MessagePack content negotiation for list endpoints."""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Optional
+
+import ormsgpack
+import pytest
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from app.utils.msgpack_response import (
+    MSGPACK_MEDIA_TYPE,
+    msgpack_response,
+    wants_msgpack,
+)
+
+
+class RowSchema(BaseModel):
+    id: int
+    title: str
+    due_date: Optional[date]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+def _request(accept=None):
+    headers = [(b"accept", accept.encode())] if accept is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, False),
+        ("application/json", False),
+        (MSGPACK_MEDIA_TYPE, True),
+        (f"application/json;q=0.5, {MSGPACK_MEDIA_TYPE}", True),
+    ],
+)
+def test_wants_msgpack(accept, expected):
+    assert wants_msgpack(_request(accept)) is expected
+
+
+def test_msgpack_response_round_trip():
+    rows = [
+        SimpleNamespace(
+            id=1,
+            title="Apply neem oil",
+            due_date=date(2024, 6, 1),
+            created_at=datetime(2024, 5, 30, 8, 15),
+            internal="not in the schema",
+        ),
+        SimpleNamespace(
+            id=2, title="Monitor", due_date=None, created_at=datetime(2024, 5, 31)
+        ),
+    ]
+
+    response = msgpack_response(rows, RowSchema)
+    decoded = ormsgpack.unpackb(response.body)
+
+    assert response.media_type == MSGPACK_MEDIA_TYPE
+    assert [RowSchema.model_validate(item) for item in decoded] == [
+        RowSchema.model_validate(row) for row in rows
+    ]
+    assert "internal" not in decoded[0]
+
+
+def test_msgpack_response_empty():
+    assert ormsgpack.unpackb(msgpack_response([], RowSchema).body) == []